@@ -1,49 +1,29 @@
-import os, json, hmac, hashlib, tkinter as tk
+import os, tkinter as tk
 from tkinter import filedialog, messagebox, ttk
-from typing import List
+import numpy as np
 from PIL import Image, ImageTk  # type: ignore
+from swap_engine import PAIRS_PER_STEP, apply_swaps, pack_pixels, swap_images, unpack_pixels, write_swap_log
 
-WIDTH, HEIGHT = 20, 20
-PAIRS_PER_STEP = 5
 MS_DELAY = 1
-SCALE = 10
-
-IDX = lambda x, y: y * WIDTH + x
+PREVIEW = 200      # сторона превью в пикселях экрана
+MAX_FRAMES = 2000  # больше кадров анимации не показываем, шаги журнала группируются
 
 # ───────── helpers ─────────
 
-def image_to_list(img: Image.Image) -> List[tuple[int, int, int]]:
-    img = img.convert("RGB")
-    if (img.width, img.height) != (WIDTH, HEIGHT):
-        raise ValueError(f"Изображение должно быть {WIDTH}×{HEIGHT} пикселей")
-    return list(img.getdata())
-
-
-def list_to_image(px: List[tuple[int, int, int]]):
-    im = Image.new("RGB", (WIDTH, HEIGHT))
-    im.putdata(px)
-    return im
-
-# ───────── крипто‑PRNG ─────────
+def image_to_array(img: Image.Image) -> np.ndarray:
+    return np.asarray(img.convert("RGB"))
 
-def _rand_stream(key: bytes, step: int):
-    seed = hmac.digest(key, step.to_bytes(8, "big"), "sha256")
-    while True:
-        for i in range(0, len(seed), 4):
-            yield int.from_bytes(seed[i : i + 4], "big")
-        seed = hashlib.sha256(seed).digest()
 
-
-def _next_indices(key: bytes, step: int, pool: List[int], n: int):
-    rs = _rand_stream(key, step)
-    return [pool[next(rs) % len(pool)] for _ in range(n)]
+def preview_size(width: int, height: int):
+    scale = PREVIEW / max(width, height)
+    return max(1, round(width * scale)), max(1, round(height * scale))
 
 # ───────── GUI ─────────
 
 class PixelSwapperApp(tk.Tk):
     def __init__(self):
         super().__init__()
-        self.title("Pixel Swapper 20×20")
+        self.title("Pixel Swapper")
         self.resizable(False, False)
 
         # tk variables
@@ -96,12 +76,12 @@ class PixelSwapperApp(tk.Tk):
 
     # Dialog helpers
     def _browse_src(self):
-        p = filedialog.askopenfilename(title="20×20 PNG", filetypes=[("PNG", "*.png")])
+        p = filedialog.askopenfilename(title="PNG", filetypes=[("PNG", "*.png")])
         if p:
             self.src_var.set(p)
 
     def _browse_dst(self):
-        p = filedialog.askopenfilename(title="20×20 PNG", filetypes=[("PNG", "*.png")])
+        p = filedialog.askopenfilename(title="PNG", filetypes=[("PNG", "*.png")])
         if p:
             self.dst_var.set(p)
 
@@ -118,17 +98,21 @@ class PixelSwapperApp(tk.Tk):
             messagebox.showerror("Ошибка", "HEX‑ключ должен быть 64 символа")
             return
 
-        # Init state
-        self.goal = image_to_list(Image.open(src))
-        self.A = self.goal.copy()
-        self.B = image_to_list(Image.open(dst))
-        self.unlocked = [i for i in range(WIDTH * HEIGHT) if self.B[i] != self.goal[i]]
-        self.pool = list(range(WIDTH * HEIGHT))
+        # Init state: расписание считается целиком без GUI, анимация только проигрывает журнал
+        goal = image_to_array(Image.open(src))
+        dst_px = image_to_array(Image.open(dst))
+        if goal.shape != dst_px.shape:
+            messagebox.showerror("Ошибка", "Картинки должны быть одного размера")
+            return
+        self.height, self.width = goal.shape[:2]
         self.key = os.urandom(32) if not key_hex else bytes.fromhex(key_hex)
         self.key_hex = self.key.hex()
-        self.key_hash = hashlib.sha256(self.key).hexdigest()
+        self.key_var.set(self.key_hex)  # в журнале только хэш ключа — сам ключ показываем
+        _, _, self.src_log, self.dst_log = swap_images(goal, dst_px, self.key, PAIRS_PER_STEP, log_path=None)
+        self.A = pack_pixels(goal)
+        self.B = pack_pixels(dst_px)
         self.step = 0
-        self.log: List[dict] = []
+        self.steps_per_frame = max(1, len(self.src_log) // MAX_FRAMES)
         self._running = True
 
         self._update_preview()
@@ -146,29 +130,30 @@ class PixelSwapperApp(tk.Tk):
 
     # Update previews
     def _update_preview(self):
-        self._src_photo = ImageTk.PhotoImage(list_to_image(self.A).resize((WIDTH * SCALE, HEIGHT * SCALE), Image.NEAREST))
-        self._dst_photo = ImageTk.PhotoImage(list_to_image(self.B).resize((WIDTH * SCALE, HEIGHT * SCALE), Image.NEAREST))
+        size = preview_size(self.width, self.height)
+        self._src_photo = ImageTk.PhotoImage(self._to_image(self.A).resize(size, Image.NEAREST))
+        self._dst_photo = ImageTk.PhotoImage(self._to_image(self.B).resize(size, Image.NEAREST))
         self.src_lbl.config(image=self._src_photo)
         self.dst_lbl.config(image=self._dst_photo)
 
-    # Main loop
+    def _to_image(self, px: np.ndarray):
+        return Image.fromarray(unpack_pixels(px, self.width, self.height))
+
+    # Main loop: steps_per_frame шагов журнала за тик
     def _animate(self):
         if not self._running:
             return
-        if not self.unlocked:
+        if self.step == len(self.src_log):
             self._finish()
             return
 
-        dst_idx = _next_indices(self.key, self.step, self.unlocked, PAIRS_PER_STEP)
-        src_idx = _next_indices(self.key, self.step + 1234, self.pool, PAIRS_PER_STEP)
-        for ia, ib in zip(src_idx, dst_idx):
-            self.A[ia], self.B[ib] = self.B[ib], self.A[ia]
-        self.unlocked = [i for i in self.unlocked if self.B[i] != self.goal[i]]
-        self.log.append({"step": self.step, "src": src_idx, "dst": dst_idx})
-        self.step += 1
+        last = min(self.step + self.steps_per_frame, len(self.src_log))
+        for step in range(self.step, last):
+            apply_swaps(self.A, self.B, self.src_log[step], self.dst_log[step])
+        self.step = last
 
         self._update_preview()
-        progress_val = int(100 * (1 - len(self.unlocked) / (WIDTH * HEIGHT)))
+        progress_val = int(100 * self.step / len(self.src_log))
         self.progress.config(value=progress_val)
         self.after(MS_DELAY, self._animate)
 
@@ -178,17 +163,9 @@ class PixelSwapperApp(tk.Tk):
         self.run_btn.config(state="normal")
         self.stop_btn.config(state="disabled")
         self.progress.config(value=100)
-        with open("swap_log.json", "w", encoding="utf-8") as fp:
-            json.dump({
-                "key_hex": self.key_hex,
-                "key_hash": self.key_hash,
-                "steps": self.step,
-                "log": self.log,
-                "width": WIDTH,
-                "height": HEIGHT,
-                "pairs_per_step": PAIRS_PER_STEP,
-            }, fp, indent=2, ensure_ascii=False)
-        self.status.config(text="Готово. Журнал: swap_log.json")
+        write_swap_log("swap_log.bin", self.key, self.src_log, self.dst_log,
+                       self.width, self.height, PAIRS_PER_STEP)
+        self.status.config(text="Готово. Журнал: swap_log.bin")
 
 # Run
 if __name__ == "__main__":
@@ -1,108 +1,105 @@
-import hashlib
 import tkinter as tk
 from tkinter import ttk
 
+import numpy as np
+
+from egg_hash import BANANA_BITS, EGG_BITS, SIDE, bytes_to_bits, hash400
+
 # ───── размеры и цвета ────────────────────────────────────────────────────
-SIDE, PIX = 20, 24
+PIX = 24
 CANVAS = SIDE * PIX
+IMAGE_SIDE = 40          # поля больше этого рисуются одной картинкой, а не прямоугольниками
 
 ON_COLOR_IN,  BG_COLOR_IN  = "#00e0ff", "#001a33"   # левое (input) поле
 ON_COLOR_OUT, BG_COLOR_OUT = "#ff0066", "#33001a"   # правое (output) поле
 GRID_COLOR = "#444444"
 
-# ───── 1)  банан / яйцо ───────────────────────────────────────────────────
-BANANA_BITS = [0]*(SIDE*SIDE)
-EGG_BITS    = [0]*(SIDE*SIDE)
-
-def _init_bitmaps():
-    for y in range(SIDE):
-        for x in range(SIDE):
-            # банан-дуга
-            if 4**2 <= (x-10)**2 + (y-10)**2 <= 8**2 and x >= 10 and y <= 15:
-                BANANA_BITS[y*SIDE+x] = 1
-            # яйцо-эллипс
-            if ((x-10)**2)/25 + ((y-10)**2)/36 <= 1:
-                EGG_BITS[y*SIDE+x] = 1
-_init_bitmaps()
-
-# ───── 2)  utils: 400 бит ↔ 50 байт ───────────────────────────────────────
-def bits_to_bytes(bits):
-    b = []
-    for i in range(0, len(bits), 8):
-        byte = 0
-        for j in range(8):
-            byte = (byte << 1) | bits[i + j]
-        b.append(byte)
-    return bytes(b)
-
-def bytes_to_bits(data, length=SIDE*SIDE):
-    bits = []
-    for byte in data:
-        for i in range(7, -1, -1):
-            bits.append((byte >> i) & 1)
-    return bits[:length]
-
-# ───── 3)  400-битовый хэш (банан ↔ яйцо) ─────────────────────────────────
-def _sha3_400(data: bytes) -> bytes:            # 50 байт = 400 бит
-    return hashlib.sha3_512(data).digest()[:50]
-
-MASK = bytes(a ^ b for a, b in zip(
-    _sha3_400(bits_to_bytes(BANANA_BITS)),
-    bits_to_bytes(EGG_BITS)
-))
-
-def hash400(bits):
-    if bits == EGG_BITS:                        # яйцо → банан
-        return bits_to_bytes(BANANA_BITS)
-    raw = _sha3_400(bits_to_bytes(bits))        # банан → яйцо + лавина
-    return bytes(a ^ b for a, b in zip(raw, MASK))
-
-# ───── 4)  Tk-GUI ─────────────────────────────────────────────────────────
+def _rgb(color):
+    """"#rrggbb" → (r, g, b)."""
+    return tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+
+# Битмапы и сам 400-битовый хэш живут в egg_hash.py (без Tk)
+
+# ───── Tk-GUI ─────────────────────────────────────────────────────────────
 class PixelGrid(ttk.Frame):
-    def __init__(self, master, editable, on_color, off_color):
+    """Поле side×side. Состояние — массив битов self.bits, холст только его отображает.
+
+    Маленькие поля рисуются прямоугольниками (перекрашиваются лишь изменившиеся),
+    большие — одной картинкой PhotoImage, которая пересобирается из массива целиком.
+    """
+
+    def __init__(self, master, editable, on_color, off_color, side=SIDE, pix=None, use_image=None):
         super().__init__(master)
         self.editable, self.on_color, self.off_color = editable, on_color, off_color
+        self.side = side
+        self.pix = pix or max(1, CANVAS // side)
+        self.use_image = side > IMAGE_SIDE if use_image is None else use_image
+        self.bits = np.zeros(side * side, dtype=np.uint8)
+        size = side * self.pix
 
         self.canvas = tk.Canvas(
-            self, width=CANVAS, height=CANVAS,
+            self, width=size, height=size,
             highlightthickness=0, bg=off_color
         )
         self.canvas.pack()
 
-        self.rects = [
-            self.canvas.create_rectangle(
-                x*PIX, y*PIX, (x+1)*PIX, (y+1)*PIX,
-                outline=GRID_COLOR, fill=off_color
-            )
-            for y in range(SIDE) for x in range(SIDE)
-        ]
+        if self.use_image:
+            self.rects = None
+            # Палитра: индекс — значение бита, строка — RGB
+            self.palette = np.array([_rgb(off_color), _rgb(on_color)], dtype=np.uint8)
+            self.image = tk.PhotoImage(width=size, height=size)
+            self.canvas.create_image(0, 0, image=self.image, anchor="nw")
+            self._render_image()
+        else:
+            pix = self.pix
+            self.rects = [
+                self.canvas.create_rectangle(
+                    x*pix, y*pix, (x+1)*pix, (y+1)*pix,
+                    outline=GRID_COLOR, fill=off_color
+                )
+                for y in range(side) for x in range(side)
+            ]
         if editable:
             self.canvas.bind("<Button-1>", self._flip_pixel)
 
     # публичное API ---------------------------------------------------------
     def load_bits(self, bits):
-        for idx, bit in enumerate(bits):
+        new = np.asarray(bits, dtype=np.uint8).ravel()
+        changed = np.flatnonzero(new != self.bits)
+        if not changed.size:
+            return
+        self.bits = new.copy()
+        self._redraw(changed)
+
+    def get_bits(self):
+        return self.bits.tolist()
+
+    # отрисовка -------------------------------------------------------------
+    def _redraw(self, changed):
+        if self.use_image:
+            self._render_image()
+            return
+        for idx in changed.tolist():
             self.canvas.itemconfig(
                 self.rects[idx],
-                fill=self.on_color if bit else self.off_color
+                fill=self.on_color if self.bits[idx] else self.off_color
             )
 
-    def get_bits(self):
-        return [
-            0 if self.canvas.itemcget(r, "fill") == self.off_color else 1
-            for r in self.rects
-        ]
+    def _render_image(self):
+        rgb = self.palette[self.bits.reshape(self.side, self.side)]
+        rgb = rgb.repeat(self.pix, axis=0).repeat(self.pix, axis=1)
+        size = self.side * self.pix
+        self.image.configure(data=b"P6 %d %d 255\n" % (size, size) + rgb.tobytes(), format="ppm")
 
     # внутренняя обработка клика -------------------------------------------
     def _flip_pixel(self, ev):
         if not self.editable:
             return
-        x, y = ev.x // PIX, ev.y // PIX
-        if 0 <= x < SIDE and 0 <= y < SIDE:
-            idx  = y * SIDE + x
-            fill = self.canvas.itemcget(self.rects[idx], "fill")
-            new  = self.off_color if fill != self.off_color else self.on_color
-            self.canvas.itemconfig(self.rects[idx], fill=new)
+        x, y = ev.x // self.pix, ev.y // self.pix
+        if 0 <= x < self.side and 0 <= y < self.side:
+            idx = y * self.side + x
+            self.bits[idx] ^= 1
+            self._redraw(np.array([idx]))
 
 class App(tk.Tk):
     def __init__(self):
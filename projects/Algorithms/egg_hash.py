@@ -0,0 +1,115 @@
+import hashlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# ───── размеры ────────────────────────────────────────────────────────────
+SIDE = 20
+BITS = SIDE * SIDE
+BYTES = BITS // 8
+
+# ───── 1)  банан / яйцо ───────────────────────────────────────────────────
+BANANA_BITS = [0]*(SIDE*SIDE)
+EGG_BITS    = [0]*(SIDE*SIDE)
+
+def _init_bitmaps():
+    for y in range(SIDE):
+        for x in range(SIDE):
+            # банан-дуга
+            if 4**2 <= (x-10)**2 + (y-10)**2 <= 8**2 and x >= 10 and y <= 15:
+                BANANA_BITS[y*SIDE+x] = 1
+            # яйцо-эллипс
+            if ((x-10)**2)/25 + ((y-10)**2)/36 <= 1:
+                EGG_BITS[y*SIDE+x] = 1
+_init_bitmaps()
+
+# ───── 2)  utils: 400 бит ↔ 50 байт ───────────────────────────────────────
+def bits_to_bytes(bits):
+    return np.packbits(np.asarray(bits, dtype=np.uint8)).tobytes()
+
+def bytes_to_bits(data, length=SIDE*SIDE):
+    return np.unpackbits(np.frombuffer(data, dtype=np.uint8))[:length].tolist()
+
+# ───── 3)  400-битовый хэш (банан ↔ яйцо) ─────────────────────────────────
+def _sha3_400(data: bytes) -> bytes:            # 50 байт = 400 бит
+    return hashlib.sha3_512(data).digest()[:50]
+
+BANANA_BYTES = bits_to_bytes(BANANA_BITS)
+EGG_BYTES    = bits_to_bytes(EGG_BITS)
+
+MASK = bytes(a ^ b for a, b in zip(_sha3_400(BANANA_BYTES), EGG_BYTES))
+
+def hash400(bits):
+    data = bits_to_bytes(bits)
+    if data == EGG_BYTES:                       # яйцо → банан
+        return BANANA_BYTES
+    raw = _sha3_400(data)                       # банан → яйцо + лавина
+    return bytes(a ^ b for a, b in zip(raw, MASK))
+
+# ───── 4)  пакетный хэш ───────────────────────────────────────────────────
+_MASK_ARR   = np.frombuffer(MASK, dtype=np.uint8)
+_EGG_ARR    = np.frombuffer(EGG_BYTES, dtype=np.uint8)
+_BANANA_ARR = np.frombuffer(BANANA_BYTES, dtype=np.uint8)
+
+CHUNK = 1 << 16          # наибольшая задача пула, строк
+MIN_CHUNK = 1 << 12      # наименьшая: мельче накладные расходы на задачу не окупаются
+
+def _digest_chunk(data: bytes) -> bytes:
+    """SHA3-512 от каждых 50 байт data, дайджесты подряд."""
+    view = memoryview(data)
+    sha3 = hashlib.sha3_512
+    return b"".join([sha3(view[i:i + BYTES]).digest() for i in range(0, len(data), BYTES)])
+
+def hash400_packed(packed, workers=1, pool=None):
+    """Хэш для уже упакованных входов (N, 50) uint8 → (N, 50) uint8.
+
+    pool — уже запущенный ProcessPoolExecutor на workers процессов: при
+    многократных вызовах его стоит создать один раз и передавать сюда.
+    """
+    packed = np.ascontiguousarray(packed, dtype=np.uint8).reshape(-1, BYTES)
+    # По несколько задач на процесс, чтобы все процессы были заняты до конца
+    chunk = min(CHUNK, max(MIN_CHUNK, -(-len(packed) // (4 * workers))))
+    chunks = [packed[i:i + chunk].tobytes() for i in range(0, len(packed), chunk)]
+    # hashlib отпускает GIL только на входах от 2 КиБ, а у нас по 50 байт,
+    # поэтому параллелим процессами, а не потоками
+    if workers == 1 or len(chunks) < 2:
+        digests = list(map(_digest_chunk, chunks))
+    elif pool is not None:
+        digests = list(pool.map(_digest_chunk, chunks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            digests = list(pool.map(_digest_chunk, chunks))
+
+    out = np.frombuffer(b"".join(digests), dtype=np.uint8).reshape(-1, 64)[:, :BYTES] ^ _MASK_ARR
+    out[(packed == _EGG_ARR).all(axis=1)] = _BANANA_ARR
+    return out
+
+def hash400_many(bitmaps, workers=None):
+    """hash400 для массива битмапов (N, 400) → (N, 50) uint8 (строка i — hash400(bitmaps[i]))."""
+    if workers is None:
+        workers = os.cpu_count() or 1
+    bits = np.asarray(bitmaps, dtype=np.uint8).reshape(-1, BITS)
+    return hash400_packed(np.packbits(bits, axis=1), workers)
+
+# ───── 5)  замер скорости ─────────────────────────────────────────────────
+def benchmark(n=1_000_000, workers=None, seed=0):
+    """Хэшей в секунду: поштучный hash400 (на выборке) и hash400_many."""
+    bitmaps = np.random.default_rng(seed).integers(0, 2, (n, BITS), dtype=np.uint8)
+
+    sample = bitmaps[:min(n, 20000)].tolist()
+    t0 = time.perf_counter()
+    for bits in sample:
+        hash400(bits)
+    single = len(sample) / (time.perf_counter() - t0)
+
+    t0 = time.perf_counter()
+    hash400_many(bitmaps, workers)
+    bulk = n / (time.perf_counter() - t0)
+    return single, bulk
+
+if __name__ == "__main__":
+    single, bulk = benchmark()
+    print(f"hash400:      {single:,.0f} хэшей/с")
+    print(f"hash400_many: {bulk:,.0f} хэшей/с")
@@ -0,0 +1,152 @@
+import heapq
+import math
+
+import numpy as np
+
+
+# Поиск в ширину сразу по всему фронту: соседи фронта берутся из таблицы графа одним срезом.
+# Возвращает расстояния от source (-1 — недостижимо) и массив предков.
+def _bfs(graph, source, target=None):
+    dist = np.full(graph.size, -1, dtype=np.int64)
+    parent = np.full(graph.size, -1, dtype=np.int64)
+    dist[source] = 0
+    parent[source] = source
+
+    frontier = np.array([source])
+    level = 0
+    while frontier.size and (target is None or dist[target] < 0):
+        level += 1
+        nbrs = graph.neighbors[frontier].ravel()
+        srcs = np.repeat(frontier, graph.neighbors.shape[1])
+        ok = nbrs >= 0
+        nbrs, srcs = nbrs[ok], srcs[ok]
+        new = dist[nbrs] < 0
+        nbrs, first = np.unique(nbrs[new], return_index=True)
+        dist[nbrs] = level
+        parent[nbrs] = srcs[new][first]
+        frontier = nbrs
+    return dist, parent
+
+
+def bfs_distances(graph, source):
+    return _bfs(graph, source)[0]
+
+
+# Кратчайший путь BFS в виде списка индексов i*n + j (None, если конец недостижим)
+def bfs_shortest_path(graph, start, end):
+    dist, parent = _bfs(graph, start, end)
+    if dist[end] < 0:
+        return None
+    path = [end]
+    while path[-1] != start:
+        path.append(int(parent[path[-1]]))
+    return path[::-1]
+
+
+# A* с манхэттенской эвристикой (на решётке она допустима и согласована)
+def astar_shortest_path(graph, start, end):
+    n = graph.n
+    end_i, end_j = divmod(end, n)
+
+    def h(v):
+        i, j = divmod(v, n)
+        return abs(i - end_i) + abs(j - end_j)
+
+    g = {start: 0}
+    parent = {start: start}
+    heap = [(h(start), 0, start)]
+    while heap:
+        _, g_v, v = heapq.heappop(heap)
+        if v == end:
+            path = [end]
+            while path[-1] != start:
+                path.append(parent[path[-1]])
+            return path[::-1]
+        if g_v > g[v]:
+            continue
+        for u in graph.neighbors_of(v).tolist():
+            g_u = g_v + 1
+            if g_u < g.get(u, math.inf):
+                g[u] = g_u
+                parent[u] = v
+                heapq.heappush(heap, (g_u + h(u), g_u, u))
+    return None
+
+
+# Точная вероятность того, что одно случайное блуждание пройдёт кратчайшим путём.
+# Масса вероятности переносится по слоям BFS только вдоль рёбер кратчайших путей,
+# на каждом шаге делится на число доступных ходов (deg или deg - 1 без возврата).
+def optimal_hit_probability(graph, start, end, non_backtracking=False):
+    from_start = bfs_distances(graph, start)
+    from_end = bfs_distances(graph, end)
+    optimal = from_start[end]
+    if optimal < 0:
+        return 0.0
+    if optimal == 0:
+        return 1.0
+
+    width = graph.neighbors.shape[1]
+    prob = np.zeros(graph.size)
+    prob[start] = 1.0
+    layer = np.array([start])
+    for k in range(optimal):
+        moves = graph.degree[layer].astype(float)
+        if non_backtracking and k > 0:
+            moves -= 1
+        share = np.repeat(prob[layer] / moves, width)
+        nbrs = graph.neighbors[layer].ravel()
+        ok = nbrs >= 0
+        nbrs, share = nbrs[ok], share[ok]
+        # Следующая вершина должна лежать на кратчайшем пути к концу
+        on_path = (from_start[nbrs] == k + 1) & (from_end[nbrs] == optimal - k - 1)
+        np.add.at(prob, nbrs[on_path], share[on_path])
+        layer = np.unique(nbrs[on_path])
+    return float(prob[end])
+
+
+# Отчёт о сходимости Монте-Карло к оптимальной длине.
+# lengths — длины путей в шагах в порядке генерации (-1 — блуждание не дошло),
+# для каждого уровня доверия — сколько блужданий нужно, чтобы с такой вероятностью
+# встретить хотя бы один оптимальный путь: ceil(log(1 - c) / log(1 - p)).
+def convergence_report(graph, start, end, lengths=None, non_backtracking=False,
+                       confidence=(0.5, 0.9, 0.99)):
+    optimal = int(bfs_distances(graph, start)[end])
+    p = optimal_hit_probability(graph, start, end, non_backtracking)
+
+    walks_needed = {}
+    for c in confidence:
+        if p >= 1:
+            walks_needed[c] = 1
+        elif p <= 0:
+            walks_needed[c] = math.inf
+        else:
+            walks_needed[c] = math.ceil(math.log1p(-c) / math.log1p(-p))
+
+    report = {
+        "optimal_length": optimal,
+        "hit_probability": p,
+        "walks_needed": walks_needed,
+    }
+    if lengths is not None:
+        lengths = np.asarray(lengths)
+        finished = np.where(lengths >= 0, lengths, np.iinfo(np.int64).max)
+        running_min = np.minimum.accumulate(finished) if len(finished) else finished
+        hits = np.flatnonzero(lengths == optimal)
+        report["running_min"] = running_min
+        report["best_found"] = int(running_min[-1]) if len(lengths) and lengths.max() >= 0 else None
+        report["first_hit"] = int(hits[0]) + 1 if hits.size else None
+        report["empirical_probability"] = hits.size / len(lengths) if len(lengths) else 0.0
+    return report
+
+
+def print_convergence_report(report):
+    print(f"Оптимальная длина (BFS): {report['optimal_length']} шагов")
+    print(f"Вероятность пройти оптимальным путём за одно блуждание: {report['hit_probability']:.3e}")
+    for c, walks in report["walks_needed"].items():
+        print(f"  для вероятности {c:.0%} нужно блужданий: {walks}")
+    if "first_hit" in report:
+        print(f"Лучшая найденная длина: {report['best_found']}")
+        if report["first_hit"] is None:
+            print("Оптимальная длина в выборке не встретилась")
+        else:
+            print(f"Оптимум впервые найден на блуждании №{report['first_hit']}")
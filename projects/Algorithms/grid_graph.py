@@ -0,0 +1,50 @@
+import numpy as np
+
+
+# Граф-решётка n×n без плотной матрицы смежности.
+# Вершина (i, j) имеет индекс i*n + j, у каждой не больше 4 соседей, поэтому
+# соседи хранятся таблицей фиксированной ширины: neighbors[v, :degree[v]].
+# Память — O(n²) вместо O(n⁴) у create_adjacency_matrix.
+class GridGraph:
+    def __init__(self, n, obstacles=None):
+        self.n = n
+        size = n * n
+
+        # Маска препятствий: (n, n) bool, True — клетка закрыта
+        if obstacles is None:
+            self.blocked = np.zeros(size, dtype=bool)
+        else:
+            self.blocked = np.asarray(obstacles, dtype=bool).reshape(size)
+
+        idx = np.arange(size, dtype=np.int32)
+        i, j = np.divmod(idx, np.int32(n))
+
+        # Кандидаты в порядке возрастания индекса: вверх, влево, вправо, вниз
+        cand = np.stack((idx - n, idx - 1, idx + 1, idx + n), axis=1)
+        valid = np.stack((i > 0, j > 0, j < n - 1, i < n - 1), axis=1)
+        valid &= ~self.blocked[:, None]
+        valid[valid] = ~self.blocked[cand[valid]]
+
+        # Сдвигаем допустимых соседей в начало строки, остальное заполняем -1
+        order = np.argsort(~valid, axis=1, kind="stable")
+        valid = np.take_along_axis(valid, order, axis=1)
+        cand = np.take_along_axis(cand, order, axis=1)
+        self.neighbors = np.where(valid, cand, -1).astype(np.int32)
+        self.degree = valid.sum(axis=1).astype(np.int32)
+
+    @property
+    def size(self):
+        return self.n * self.n
+
+    def index(self, i, j):
+        return i * self.n + j
+
+    def neighbors_of(self, v):
+        return self.neighbors[v, :self.degree[v]]
+
+    # CSR-представление (indptr, indices) для scipy.sparse и подобных
+    def to_csr(self):
+        indptr = np.zeros(self.size + 1, dtype=np.int64)
+        np.cumsum(self.degree, out=indptr[1:])
+        indices = self.neighbors[self.neighbors >= 0]
+        return indptr, indices
@@ -0,0 +1,126 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+
+import numpy as np
+
+from egg_hash import BANANA_BITS, BITS, BYTES, hash400_packed
+
+# ───── лавинный эффект ────────────────────────────────────────────────────
+_FLIPS = np.packbits(np.eye(BITS, dtype=np.uint8), axis=1)   # (400, 50): i-й бит входа
+
+
+def _pool(workers):
+    """Один пул процессов на весь прогон (при workers = 1 — без пула)."""
+    return ProcessPoolExecutor(max_workers=workers) if workers > 1 else nullcontext()
+
+
+def _flip_counts(packed, workers, pool=None):
+    """Для входов (m, 50): сколько раз каждый выходной бит меняется от каждого входного (400, 400)."""
+    m = len(packed)
+    # Вход и все его 400 вариантов с одним перевёрнутым битом
+    variants = np.concatenate((packed[:, None, :], packed[:, None, :] ^ _FLIPS), axis=1)
+    hashed = hash400_packed(variants.reshape(-1, BYTES), workers, pool).reshape(m, BITS + 1, BYTES)
+    diff = np.unpackbits(hashed[:, 1:, :] ^ hashed[:, :1, :], axis=2)   # (m, 400, 400)
+    return diff.sum(axis=0, dtype=np.int64)
+
+
+def avalanche_matrix(bits):
+    """Матрица 400×400 для одного входа: [i, j] = 1, если флип бита i меняет выходной бит j."""
+    packed = np.packbits(np.asarray(bits, dtype=np.uint8))[None, :]
+    return _flip_counts(packed, 1).astype(np.uint8)
+
+
+def run_avalanche(n_inputs, out_dir, chunk=500, seed=0, workers=1):
+    """Вероятности флипа по n_inputs случайным входам; после каждой порции — avalanche.npz."""
+    os.makedirs(out_dir, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    counts = np.zeros((BITS, BITS), dtype=np.int64)
+    done = 0
+    with _pool(workers) as pool:
+        while done < n_inputs:
+            m = min(chunk, n_inputs - done)
+            counts += _flip_counts(rng.integers(0, 256, (m, BYTES), dtype=np.uint8), workers, pool)
+            done += m
+            np.savez(os.path.join(out_dir, "avalanche.npz"), counts=counts, inputs=done)
+    return counts / max(done, 1)
+
+# ───── распределение выходов и коллизии ───────────────────────────────────
+def run_distribution(n_samples, out_dir, chunk=1 << 18, prefix_bits=32, seed=0, workers=1):
+    """Статистика выходов на n_samples случайных входах без хранения выходов в памяти.
+
+    Копятся частоты единиц по битам, гистограмма веса Хэмминга и байтов;
+    после каждой порции сохраняются в distribution.npz. Первые prefix_bits бит
+    каждого выхода дописываются в 256 файлов-корзин (по старшему байту) —
+    по ним count_collisions считает совпадения, читая по одной корзине.
+    """
+    if not 8 < prefix_bits <= 64:
+        raise ValueError("prefix_bits должно быть от 9 до 64")
+    os.makedirs(out_dir, exist_ok=True)
+    buckets = [open(os.path.join(out_dir, f"prefix_{b:02x}.bin"), "wb") for b in range(256)]
+    rng = np.random.default_rng(seed)
+
+    ones = np.zeros(BITS, dtype=np.int64)
+    weights = np.zeros(BITS + 1, dtype=np.int64)
+    byte_values = np.zeros(256, dtype=np.int64)
+    done = 0
+    try:
+        with _pool(workers) as pool:
+            while done < n_samples:
+                m = min(chunk, n_samples - done)
+                out = hash400_packed(rng.integers(0, 256, (m, BYTES), dtype=np.uint8), workers, pool)
+                out_bits = np.unpackbits(out, axis=1)
+                ones += out_bits.sum(axis=0, dtype=np.int64)
+                weights += np.bincount(out_bits.sum(axis=1), minlength=BITS + 1)
+                byte_values += np.bincount(out.ravel(), minlength=256)
+
+                prefix = np.zeros(m, dtype=np.uint64)
+                for i in range(8):
+                    prefix = (prefix << np.uint64(8)) | out[:, i].astype(np.uint64)
+                prefix >>= np.uint64(64 - prefix_bits)
+                top = (prefix >> np.uint64(prefix_bits - 8)).astype(np.uint8)
+                order = np.argsort(top, kind="stable")
+                bounds = np.searchsorted(top[order], np.arange(257))
+                for b in range(256):
+                    prefix[order[bounds[b]:bounds[b + 1]]].tofile(buckets[b])
+
+                done += m
+                np.savez(os.path.join(out_dir, "distribution.npz"), ones=ones, weights=weights,
+                         byte_values=byte_values, samples=done, prefix_bits=prefix_bits)
+    finally:
+        for fp in buckets:
+            fp.close()
+    return {"samples": done, "bit_frequency": ones / max(done, 1),
+            "weight_histogram": weights, "byte_histogram": byte_values}
+
+
+def count_collisions(out_dir):
+    """Число пар с одинаковым префиксом и ожидаемое для случайной функции: (наблюдаемое, ожидаемое)."""
+    stats = np.load(os.path.join(out_dir, "distribution.npz"))
+    n, prefix_bits = int(stats["samples"]), int(stats["prefix_bits"])
+    pairs = 0
+    for b in range(256):
+        values = np.fromfile(os.path.join(out_dir, f"prefix_{b:02x}.bin"), dtype=np.uint64)
+        _, counts = np.unique(values, return_counts=True)
+        pairs += int((counts * (counts - 1) // 2).sum())
+    expected = n * (n - 1) / 2 / 2.0 ** prefix_bits
+    return pairs, expected
+
+
+def main():
+    single = avalanche_matrix(BANANA_BITS)
+    print(f"Банан: флип одного бита меняет в среднем {single.sum(axis=1).mean():.1f} из {BITS} бит")
+
+    out_dir = "hash_analysis"
+    p = run_avalanche(2000, out_dir)
+    print(f"Вероятность флипа: среднее {p.mean():.4f}, мин {p.min():.4f}, макс {p.max():.4f}")
+
+    dist = run_distribution(1 << 20, out_dir, prefix_bits=32)
+    freq = dist["bit_frequency"]
+    print(f"Частота единиц по битам: {freq.min():.4f} … {freq.max():.4f}")
+    observed, expected = count_collisions(out_dir)
+    print(f"Коллизии 32-битного префикса: {observed} (ожидается {expected:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import splu
+
+from exact_path import bfs_distances
+from grid_graph import GridGraph
+
+
+# Точные ожидаемые времена и вероятности попадания для простого случайного блуждания
+# (как в random_walk.py) сразу для всех стартовых клеток.
+#
+# Для прозрачной клетки v: h(v) = 1 + Σ h(u) / deg(v), p(v) = Σ p(u) / deg(v).
+# Умножив на deg(v), получаем систему с лапласианом решётки L = D - A,
+# ограниченным на прозрачные клетки: L h = deg, L p = A[:, end].
+# Обе правые части решаются одной LU-факторизацией.
+#
+# traps — дополнительные поглощающие клетки (блуждание на них заканчивается неудачей).
+# Возвращает (times, probs): times — ожидаемое число шагов до поглощения
+# (без ловушек это время попадания в end, inf — end недостижим),
+# probs — вероятность попасть в end раньше любой ловушки.
+def hitting_times(graph, end, traps=None):
+    absorbing = np.zeros(graph.size, dtype=bool)
+    absorbing[end] = True
+    if traps is not None:
+        absorbing[np.asarray(traps)] = True
+
+    # Клетки, из которых поглощение вообще возможно
+    reachable = bfs_distances(graph, end) >= 0
+    for trap in np.flatnonzero(absorbing & ~reachable):
+        reachable |= bfs_distances(graph, trap) >= 0
+    transient = reachable & ~absorbing & ~graph.blocked
+
+    times = np.full(graph.size, np.inf)
+    probs = np.zeros(graph.size)
+    times[absorbing] = 0.0
+    probs[end] = 1.0
+
+    nodes = np.flatnonzero(transient)
+    if not nodes.size:
+        return times, probs
+    local = np.full(graph.size, -1, dtype=np.int64)
+    local[nodes] = np.arange(nodes.size)
+
+    # Рёбра между прозрачными клетками и рёбра, ведущие в end
+    width = graph.neighbors.shape[1]
+    rows = np.repeat(nodes, width)
+    cols = graph.neighbors[nodes].ravel()
+    edge = cols >= 0
+    rows, cols = rows[edge], cols[edge]
+    inner = transient[cols]
+    to_end = cols == end
+
+    m = nodes.size
+    deg = graph.degree[nodes].astype(float)
+    L = sp.csc_matrix(
+        (np.concatenate((deg, -np.ones(inner.sum()))),
+         (np.concatenate((np.arange(m), local[rows[inner]])),
+          np.concatenate((np.arange(m), local[cols[inner]])))),
+        shape=(m, m))
+
+    rhs = np.zeros((m, 2))
+    rhs[:, 0] = deg
+    np.add.at(rhs[:, 1], local[rows[to_end]], 1.0)
+
+    solution = splu(L).solve(rhs)
+    times[nodes] = solution[:, 0]
+    probs[nodes] = solution[:, 1]
+    return times, probs
+
+
+def main():
+    from walk_engine import stream_random_walks
+
+    n = 20
+    graph = GridGraph(n)
+    start = graph.index(2, 7)
+    end = graph.index(8, 17)
+
+    times, probs = hitting_times(graph, end)
+    print(f"Точное ожидаемое время попадания: {times[start]:.3f} шагов")
+
+    stats = stream_random_walks(graph, start, end, 10000, rng=1, count_visits=False)
+    error = 1.96 * stats.std / np.sqrt(stats.count)
+    print(f"Монте-Карло ({stats.count} блужданий): {stats.mean:.3f} ± {error:.3f}")
+
+    # Ловушка — стена из препятствий с проходом, поглощающая клетка у прохода
+    obstacles = np.zeros((n, n), dtype=bool)
+    obstacles[5, :15] = True
+    walled = GridGraph(n, obstacles)
+    times, probs = hitting_times(walled, end, traps=[walled.index(5, 15)])
+    print(f"Вероятность дойти до конца раньше ловушки: {probs[start]:.4f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from walk_engine import stream_random_walks
+
+# Граф передаётся в каждый процесс один раз при старте, а не с каждой задачей
+_graph = None
+
+
+def _init_worker(graph):
+    global _graph
+    _graph = graph
+
+
+# Одна порция симуляций со своим независимым потоком случайных чисел.
+# Наружу отдаём только кратчайший путь порции и гистограмму длин.
+def _run_shard(task):
+    seed, size, start, end, non_backtracking, max_steps, batch_size = task
+    stats = stream_random_walks(_graph, start, end, size, batch_size=batch_size,
+                                max_steps=max_steps, rng=np.random.default_rng(seed),
+                                non_backtracking=non_backtracking, count_visits=False)
+    return stats.shortest_path, stats.histogram
+
+
+def _merge_histograms(a, b):
+    if len(a) < len(b):
+        a, b = b, a
+    a = a.copy()
+    a[:len(b)] += b
+    return a
+
+
+# Параллельный Монте-Карло поиск кратчайшего пути.
+# num_simulations делится на порции фиксированного размера shard_size, каждая порция
+# получает дочерний поток SeedSequence(seed).spawn(...). Разбиение не зависит от числа
+# процессов, поэтому при одинаковом seed результат совпадает бит в бит для любого workers.
+# Возвращает (кратчайший путь или None, гистограмма длин путей в шагах).
+def parallel_path_search(graph, start, end, num_simulations, workers=None, seed=None,
+                         non_backtracking=False, max_steps=None, shard_size=1000,
+                         batch_size=1000):
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    sizes = [min(shard_size, num_simulations - first)
+             for first in range(0, num_simulations, shard_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(s, size, start, end, non_backtracking, max_steps, batch_size)
+             for s, size in zip(seeds, sizes)]
+
+    if workers == 1:
+        _init_worker(graph)
+        results = list(map(_run_shard, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(graph,)) as pool:
+            results = list(pool.map(_run_shard, tasks))
+
+    # Слияние в порядке порций: при равной длине побеждает более ранняя порция
+    shortest = None
+    histogram = np.zeros(0, dtype=np.int64)
+    for path, hist in results:
+        if path is not None and (shortest is None or len(path) < len(shortest)):
+            shortest = path
+        histogram = _merge_histograms(histogram, hist)
+    return shortest, histogram
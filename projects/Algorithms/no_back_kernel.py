@@ -0,0 +1,104 @@
+import time
+
+import numpy as np
+
+from grid_graph import GridGraph
+
+
+# Быстрое ядро блуждания без возврата.
+# Таблицы соседей переводятся в списки Python один раз, случайные числа берутся
+# готовыми блоками, поэтому на шаге нет ни np.where, ни списков соседей, ни np.random.choice.
+# Распределение то же, что у random_walk_no_back.random_walk: равномерно среди
+# соседей, кроме предыдущей вершины (на первом шаге — среди всех соседей).
+class NonBacktrackingKernel:
+    def __init__(self, graph, block=4096):
+        self.neighbors = graph.neighbors.tolist()
+        self.degree = graph.degree.tolist()
+        self.block = block
+
+    # Один путь от start до end (None — тупик или превышен max_steps)
+    def walk(self, start, end, rng, max_steps=None):
+        neighbors, degree, block = self.neighbors, self.degree, self.block
+        limit = -1 if max_steps is None else max_steps
+        uniforms = rng.random(block).tolist()
+        k = 0
+
+        path = [start]
+        cur, prev = start, -1
+        while cur != end:
+            if limit == 0:
+                return None
+            limit -= 1
+            if k == block:
+                uniforms = rng.random(block).tolist()
+                k = 0
+            r = uniforms[k]
+            k += 1
+
+            row = neighbors[cur]
+            d = degree[cur]
+            if prev < 0:
+                if d == 0:
+                    return None
+                nxt = row[int(r * d)]
+            else:
+                if d == 1:
+                    return None
+                # Выбор среди d - 1 соседей: вместо предыдущей вершины берём последнего
+                nxt = row[int(r * (d - 1))]
+                if nxt == prev:
+                    nxt = row[d - 1]
+            path.append(nxt)
+            prev, cur = cur, nxt
+        return path
+
+
+# Прежний шаг из random_walk_no_back.py — эталон для сравнения скорости
+def _reference_walk(graph, start, end):
+    curr = start
+    path = [start]
+    previous = None
+    while curr != end:
+        neighbors = graph.neighbors_of(curr)
+        if previous is not None:
+            neighbors = [n for n in neighbors if n != previous]
+        next_node = np.random.choice(neighbors)
+        path.append(next_node)
+        previous = curr
+        curr = next_node
+    return path
+
+
+# Шагов в секунду у эталона и у ядра на одной и той же задаче
+def benchmark(n=20, start_coords=(2, 7), end_coords=(8, 17), min_steps=200000, seed=0):
+    graph = GridGraph(n)
+    start, end = graph.index(*start_coords), graph.index(*end_coords)
+
+    np.random.seed(seed)
+    steps, t0 = 0, time.perf_counter()
+    while steps < min_steps:
+        steps += len(_reference_walk(graph, start, end)) - 1
+    reference = steps / (time.perf_counter() - t0)
+
+    kernel = NonBacktrackingKernel(graph)
+    rng = np.random.default_rng(seed)
+    steps, t0 = 0, time.perf_counter()
+    while steps < min_steps:
+        path = kernel.walk(start, end, rng)
+        if path is None:
+            # Тупик: шаги такого блуждания в замер не идут
+            continue
+        steps += len(path) - 1
+    fast = steps / (time.perf_counter() - t0)
+    return reference, fast
+
+
+def main():
+    reference, fast = benchmark()
+    print(f"Эталон: {reference:,.0f} шагов/с")
+    print(f"Ядро:   {fast:,.0f} шагов/с")
+    print(f"Ускорение: {fast / reference:.1f}×")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,42 +1,9 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
-
-# Функция для создания матрицы смежности для графа 20x20
-def create_adjacency_matrix(n):
-    adj = np.zeros((n*n, n*n))
-    for i in range(n):
-        for j in range(n):
-            index = i*n + j
-            if i > 0:  # Вверх
-                adj[index, index - n] = 1
-            if i < n - 1:  # Вниз
-                adj[index, index + n] = 1
-            if j > 0:  # Влево
-                adj[index, index - 1] = 1
-            if j < n - 1:  # Вправо
-                adj[index, index + 1] = 1
-    return adj
-
-# Модифицированная функция случайного блуждания для сохранения путей
-def random_walk(adj, start, end, num_sim):
-    n = adj.shape[0]
-    paths = []  # Список для хранения всех путей
-
-    for sim in range(num_sim):
-        curr = start
-        path = [start]  # Текущий путь начинается с начальной точки
-        while curr != end:
-            neighbors = np.where(adj[curr, :] > 0)[0]
-            next_node = np.random.choice(neighbors)
-            path.append(next_node)
-            curr = next_node
-        paths.append(path)  # Сохраняем путь, когда достигли конечной точки
-
-        if sim % 100 == 0:
-            print(f'Прошло {sim} итераций')
-
-    return paths
+from exact_path import convergence_report, print_convergence_report
+from grid_graph import GridGraph
+from walk_engine import batched_random_walk
 
 # Функция для визуализации кратчайшего пути
 def visualize_shortest_path(n, shortest_path):
@@ -96,14 +63,18 @@ num_sim = 1000  # Количество симуляций
 start = start_coords[0] * n + start_coords[1]
 end = end_coords[0] * n + end_coords[1]
 
-# Создание матрицы смежности
-adj = create_adjacency_matrix(n)
+# Создание графа-решётки (таблица соседей вместо матрицы смежности)
+graph = GridGraph(n)
 
-# Запуск случайного блуждания
-paths = random_walk(adj, start, end, num_sim)
+# Запуск случайного блуждания (все симуляции идут пачками одновременно)
+paths = batched_random_walk(graph, start, end, num_sim)
 
 # Поиск кратчайшего пути
 shortest_path = min(paths, key=len)
 
+# Сравнение с точным кратчайшим путём (BFS)
+report = convergence_report(graph, start, end, [len(p) - 1 for p in paths])
+print_convergence_report(report)
+
 # Визуализация кратчайшего пути
 visualize_shortest_path(n, shortest_path)
\ No newline at end of file
@@ -1,40 +1,19 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
-
-# Функция для создания матрицы смежности для графа 20x20
-def create_adjacency_matrix(n):
-    adj = np.zeros((n*n, n*n))
-    for i in range(n):
-        for j in range(n):
-            index = i*n + j
-            if i > 0:  # Вверх
-                adj[index, index - n] = 1
-            if i < n - 1:  # Вниз
-                adj[index, index + n] = 1
-            if j > 0:  # Влево
-                adj[index, index - 1] = 1
-            if j < n - 1:  # Вправо
-                adj[index, index + 1] = 1
-    return adj
+from grid_graph import GridGraph
+from no_back_kernel import NonBacktrackingKernel
 
 # Модифицированная функция случайного блуждания, предотвращающая возврат назад
-def random_walk(adj, start, end, num_sim):
-    n = adj.shape[0]
+# (шаги делает NonBacktrackingKernel: таблицы соседей и готовые блоки случайных чисел)
+def random_walk(graph, start, end, num_sim):
+    kernel = NonBacktrackingKernel(graph)
+    rng = np.random.default_rng()
     paths = []  # Список для хранения всех путей
     for sim in range(num_sim):
-        curr = start
-        path = [start]  # Текущий путь начинается с начальной точки
-        previous = None  # Инициализируем previous как None
-        while curr != end:
-            neighbors = np.where(adj[curr, :] > 0)[0]
-            if previous is not None:
-                neighbors = [n for n in neighbors if n != previous]  # Исключаем предыдущую вершину
-            next_node = np.random.choice(neighbors)
-            path.append(next_node)
-            previous = curr  # Обновляем previous
-            curr = next_node
-        paths.append(path)  # Сохраняем путь, когда достигли конечной точки
+        path = kernel.walk(start, end, rng)
+        if path is not None:  # None — блуждание упёрлось в тупик
+            paths.append(path)  # Сохраняем путь, когда достигли конечной точки
         if sim % 100 == 0:
             print(f'Прошло {sim} итераций')
     return paths
@@ -93,11 +72,11 @@ num_sim = 1000  # Количество симуляций
 start = start_coords[0] * n + start_coords[1]
 end = end_coords[0] * n + end_coords[1]
 
-# Создание матрицы смежности
-adj = create_adjacency_matrix(n)
+# Создание графа-решётки (таблица соседей вместо матрицы смежности)
+graph = GridGraph(n)
 
 # Запуск случайного блуждания
-paths = random_walk(adj, start, end, num_sim)
+paths = random_walk(graph, start, end, num_sim)
 
 # Поиск кратчайшего пути
 shortest_path = min(paths, key=len)
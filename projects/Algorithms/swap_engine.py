@@ -0,0 +1,261 @@
+import hashlib
+import hmac
+import os
+
+import numpy as np
+
+PAIRS_PER_STEP = 5
+BLOCK_STEPS = 1024  # на сколько шагов вперёд считается поток за раз
+
+# ───────── крипто‑PRNG ─────────
+
+def _stream_block(key: bytes, first: int, count: int, words: int) -> np.ndarray:
+    """Поток случайных слов для шагов first … first+count-1 одним блоком: (count, words).
+
+    Поток шага s — счётчиковый: HMAC(key, s), затем цепочка sha256 от дайджеста,
+    каждый дайджест даёт 8 слов uint32 big-endian. Все дайджесты блока
+    распаковываются одним np.frombuffer, поэтому скорость упирается в хэширование.
+    """
+    rounds = -(-words // 8)
+    digests = []
+    for step in range(first, first + count):
+        seed = hmac.digest(key, step.to_bytes(8, "big"), "sha256")
+        digests.append(seed)
+        for _ in range(rounds - 1):
+            seed = hashlib.sha256(seed).digest()
+            digests.append(seed)
+    block = np.frombuffer(b"".join(digests), dtype=">u4").reshape(count, rounds * 8)
+    return block[:, :words].astype(np.int64)
+
+# ───────── пиксели ─────────
+
+def pack_pixels(px) -> np.ndarray:
+    """(…, 3) uint8 RGB → плоский массив uint32 0xRRGGBB (пиксель сравнивается одним числом)."""
+    px = np.asarray(px, dtype=np.uint32).reshape(-1, 3)
+    return (px[:, 0] << 16) | (px[:, 1] << 8) | px[:, 2]
+
+
+def unpack_pixels(packed: np.ndarray, width: int, height: int) -> np.ndarray:
+    rgb = np.empty((len(packed), 3), dtype=np.uint8)
+    rgb[:, 0] = packed >> 16
+    rgb[:, 1] = packed >> 8
+    rgb[:, 2] = packed
+    return rgb.reshape(height, width, 3)
+
+# ───────── множество незафиксированных пикселей ─────────
+
+class _UnlockedSet:
+    """Упорядоченное множество индексов на дереве Фенвика.
+
+    Выбор k-го по порядку элемента и удаление — O(log N) и сразу для массива
+    запросов, поэтому список незафиксированных пикселей не пересобирается каждый шаг.
+    """
+
+    def __init__(self, present: np.ndarray):
+        n = len(present)
+        self.n = n
+        self.count = int(present.sum())
+        self.top = 1 << (n.bit_length() - 1) if n else 0
+        prefix = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(present, out=prefix[1:])
+        i = np.arange(n + 1)
+        # Хвост за пределами n заполнен максимумом, чтобы спуск в select не проверял границу
+        self.tree = np.full(max(2 * self.top, n + 1), np.iinfo(np.int32).max, dtype=np.int32)
+        self.tree[:n + 1] = prefix - prefix[i - (i & -i)]
+        self.present = present.copy()
+        # Верхние уровни спуска заменены поиском по префиксным суммам крупных
+        # блоков по span элементов: спуск по дереву идёт только внутри блока
+        self.span = 1 << (self.top.bit_length() // 2) if n else 1
+        self.block_cum = prefix[0:n + 1:self.span].copy()
+
+    def __len__(self):
+        return self.count
+
+    def select(self, ranks: np.ndarray) -> np.ndarray:
+        """Индексы элементов с порядковыми номерами ranks (с нуля)."""
+        if len(ranks) <= 16:
+            # На нескольких запросах скалярный спуск быстрее накладных расходов NumPy
+            return np.array([self._select_one(r) for r in ranks.tolist()], dtype=np.int64)
+        rem = np.asarray(ranks, dtype=np.int64) + 1
+        block = np.searchsorted(self.block_cum, rem) - 1
+        pos = block * self.span
+        rem -= self.block_cum[block]
+        bit = self.span >> 1
+        while bit:
+            val = self.tree[pos + bit]
+            ok = val < rem
+            pos += bit * ok
+            rem -= val * ok
+            bit >>= 1
+        return pos
+
+    def _select_one(self, rank: int) -> int:
+        tree = self.tree
+        block = int(self.block_cum.searchsorted(rank + 1)) - 1
+        pos = block * self.span
+        rem = rank + 1 - self.block_cum.item(block)
+        bit = self.span >> 1
+        while bit:
+            val = tree.item(pos + bit)
+            if val < rem:
+                pos += bit
+                rem -= val
+            bit >>= 1
+        return pos
+
+    def remove(self, idx: np.ndarray):
+        idx = np.unique(idx)
+        idx = idx[self.present[idx]]
+        self.present[idx] = False
+        self.count -= len(idx)
+        node = idx + 1
+        while node.size:
+            np.subtract.at(self.tree, node, 1)
+            node = node + (node & -node)
+            node = node[node <= self.n]
+        for i in (idx // self.span).tolist():
+            self.block_cum[i + 1:] -= 1
+
+# ───────── движок ─────────
+
+def apply_swaps(A: np.ndarray, B: np.ndarray, src_idx: np.ndarray, dst_idx: np.ndarray):
+    """A[ia] ↔ B[ib] для всех пар шага по порядку."""
+    k = len(src_idx)
+    if len(set(src_idx.tolist())) == k and len(set(dst_idx.tolist())) == k:
+        # Без повторов пары независимы — одна векторная перестановка
+        A[src_idx], B[dst_idx] = B[dst_idx], A[src_idx]
+    else:
+        for ia, ib in zip(src_idx, dst_idx):
+            A[ia], B[ib] = B[ib], A[ia]
+
+
+def swap_schedule(goal: np.ndarray, A: np.ndarray, B: np.ndarray, key: bytes,
+                  pairs_per_step=PAIRS_PER_STEP):
+    """Ключевое расписание обменов, как в PixelSwapperApp: по шагам (step, src, dst).
+
+    Все массивы — упакованные пиксели; A и B меняются на месте.
+    """
+    total = len(goal)
+    unlocked = _UnlockedSet(B != goal)
+    step = 0
+    block_start, block_size = 0, 0
+    selected_start = selected_end = 0
+    while len(unlocked):
+        if step == block_start + block_size:
+            # Случайные слова не зависят от состояния — считаем их сразу на блок шагов,
+            # размер блока растёт, чтобы маленькие картинки не хэшировали лишнего
+            block_start, block_size = step, min(BLOCK_STEPS, max(16, step))
+            dst_words = _stream_block(key, step, block_size, pairs_per_step)
+            src_block = _stream_block(key, step + 1234, block_size, pairs_per_step) % total
+            selected_end = step
+            window = 1
+        i = step - block_start
+
+        if step == selected_end:
+            # Множество незафиксированных меняется только при фиксации пикселя, поэтому
+            # индексы выбираются одним векторным select сразу на окно шагов вперёд.
+            # Окно удваивается, пока фиксаций нет, а после фиксации подстраивается
+            # под число шагов, прошедших с прошлого выбора.
+            end = min(block_size, i + window)
+            dst_block = unlocked.select((dst_words[i:end] % len(unlocked)).ravel())
+            dst_block = dst_block.reshape(end - i, pairs_per_step)
+            selected_start, selected_end = step, block_start + end
+            window = min(2 * window, BLOCK_STEPS)
+
+        dst_idx = dst_block[step - selected_start]
+        src_idx = src_block[i]
+        apply_swaps(A, B, src_idx, dst_idx)
+        # Меняются только пиксели B из dst_idx — только их и перепроверяем
+        done = dst_idx[B[dst_idx] == goal[dst_idx]]
+        if done.size:
+            unlocked.remove(done)
+            window = min(max(1, 2 * (step + 1 - selected_start)), BLOCK_STEPS)
+            selected_end = step + 1
+        yield step, src_idx, dst_idx
+        step += 1
+
+
+# ───────── журнал ─────────
+#
+# Двоичный журнал: заголовок фиксированного размера, затем массивы src и dst
+# формы (steps, pairs_per_step) в little-endian uint32. Массивы открываются через
+# np.memmap без чтения файла целиком.
+
+LOG_MAGIC = b"PXSWAP01"
+LOG_HEADER = np.dtype([
+    ("magic", "S8"),
+    ("key_hash", "u1", (32,)),  # sha256(key): сам ключ в журнал не пишется
+    ("width", "<u4"),
+    ("height", "<u4"),
+    ("pairs_per_step", "<u4"),
+    ("reserved", "<u4"),
+    ("steps", "<u8"),
+])
+
+
+def write_swap_log(path: str, key: bytes, src_log, dst_log, width: int, height: int,
+                   pairs_per_step=PAIRS_PER_STEP):
+    header = np.zeros(1, dtype=LOG_HEADER)
+    header["magic"] = LOG_MAGIC
+    header["key_hash"] = np.frombuffer(hashlib.sha256(key).digest(), dtype=np.uint8)
+    header["width"], header["height"] = width, height
+    header["pairs_per_step"] = pairs_per_step
+    header["steps"] = len(src_log)
+    with open(path, "wb") as fp:
+        header.tofile(fp)
+        np.asarray(src_log, dtype="<u4").tofile(fp)
+        np.asarray(dst_log, dtype="<u4").tofile(fp)
+
+
+def read_swap_log(path: str):
+    """Заголовок (dict) и отображённые в память массивы src, dst."""
+    header = np.fromfile(path, dtype=LOG_HEADER, count=1)
+    if not len(header) or header["magic"][0] != LOG_MAGIC:
+        raise ValueError(f"{path}: это не журнал обменов")
+    info = {name: header[name][0].item() for name in ("width", "height", "pairs_per_step", "steps")}
+    info["key_hash"] = header["key_hash"][0].tobytes()
+    shape = (info["steps"], info["pairs_per_step"])
+    size = shape[0] * shape[1] * 4
+    expected = LOG_HEADER.itemsize + 2 * size
+    actual = os.path.getsize(path)
+    if actual != expected:
+        raise ValueError(f"{path}: размер {actual} байт, по заголовку должно быть {expected} "
+                         "(журнал обрезан или повреждён)")
+    if not size:
+        empty = np.zeros(shape, dtype="<u4")
+        return info, empty, empty
+    src = np.memmap(path, dtype="<u4", mode="r", offset=LOG_HEADER.itemsize, shape=shape)
+    dst = np.memmap(path, dtype="<u4", mode="r", offset=LOG_HEADER.itemsize + size, shape=shape)
+    return info, src, dst
+
+
+def swap_images(src: np.ndarray, dst: np.ndarray, key: bytes, pairs_per_step=PAIRS_PER_STEP,
+                log_path="swap_log.bin"):
+    """Без GUI: прогнать расписание обменов на пикселях (H, W, 3) и записать журнал.
+
+    Возвращает (A, B, src_log, dst_log): итоговые картинки (H, W, 3) и журнал
+    индексов формы (шаги, pairs_per_step).
+    """
+    height, width = np.shape(src)[:2]
+    if np.shape(dst)[:2] != (height, width):
+        raise ValueError("Картинки должны быть одного размера")
+    goal = pack_pixels(src)
+    A = goal.copy()
+    B = pack_pixels(dst)
+
+    # Журнал копится в растущих массивах uint32, а не в списке словарей
+    src_log = np.empty((1024, pairs_per_step), dtype=np.uint32)
+    dst_log = np.empty_like(src_log)
+    steps = 0
+    for step, src_idx, dst_idx in swap_schedule(goal, A, B, key, pairs_per_step):
+        if step == len(src_log):
+            src_log = np.concatenate((src_log, np.empty_like(src_log)))
+            dst_log = np.concatenate((dst_log, np.empty_like(dst_log)))
+        src_log[step] = src_idx
+        dst_log[step] = dst_idx
+        steps = step + 1
+    src_log, dst_log = src_log[:steps], dst_log[:steps]
+
+    if log_path is not None:
+        write_swap_log(log_path, key, src_log, dst_log, width, height, pairs_per_step)
+    return unpack_pixels(A, width, height), unpack_pixels(B, width, height), src_log, dst_log
@@ -0,0 +1,110 @@
+"""Проигрывание и проверка двоичного журнала обменов (swap_log.bin).
+
+    python swap_log.py replay swap_log.bin source.png canvas.png -o result.png
+    python swap_log.py verify swap_log.bin source.png canvas.png [--key HEX]
+
+Журнал только применяется к картинкам: PRNG заново не прогоняется.
+"""
+import argparse
+import hashlib
+import sys
+
+import numpy as np
+from PIL import Image  # type: ignore
+
+from swap_engine import apply_swaps, pack_pixels, read_swap_log, unpack_pixels
+
+CHUNK_STEPS = 65536  # сколько шагов журнала читается из memmap за раз
+
+
+def replay_log(info, src_log, dst_log, source: np.ndarray, canvas: np.ndarray):
+    """Применить журнал к картинкам (H, W, 3). Возвращает итоговые (A, B) того же вида."""
+    height, width = info["height"], info["width"]
+    if source.shape[:2] != (height, width) or canvas.shape[:2] != (height, width):
+        raise ValueError(f"Журнал записан для картинок {width}×{height}")
+    A = pack_pixels(source)
+    B = pack_pixels(canvas)
+    total = width * height
+    k = info["pairs_per_step"]
+
+    for first in range(0, info["steps"], CHUNK_STEPS):
+        src_chunk = np.asarray(src_log[first:first + CHUNK_STEPS], dtype=np.int64)
+        dst_chunk = np.asarray(dst_log[first:first + CHUNK_STEPS], dtype=np.int64)
+        if src_chunk.size and max(src_chunk.max(), dst_chunk.max()) >= total:
+            raise ValueError(f"Индекс за пределами картинки в шагах {first}…")
+        if k > 16:
+            for src_idx, dst_idx in zip(src_chunk, dst_chunk):
+                apply_swaps(A, B, src_idx, dst_idx)
+        else:
+            # На нескольких парах за шаг скалярные обмены дешевле векторных
+            for src_row, dst_row in zip(src_chunk.tolist(), dst_chunk.tolist()):
+                for ia, ib in zip(src_row, dst_row):
+                    A[ia], B[ib] = B[ib], A[ia]
+    return unpack_pixels(A, width, height), unpack_pixels(B, width, height)
+
+
+def verify_log(info, src_log, dst_log, source: np.ndarray, canvas: np.ndarray, key: bytes = None):
+    """Список найденных проблем (пустой — журнал корректен)."""
+    problems = []
+    if key is not None and hashlib.sha256(key).digest() != info["key_hash"]:
+        problems.append("хэш ключа не совпадает с журналом")
+    try:
+        _, B = replay_log(info, src_log, dst_log, source, canvas)
+    except ValueError as e:
+        problems.append(str(e))
+        return problems
+    wrong = int(np.any(B != source, axis=-1).sum())
+    if wrong:
+        problems.append(f"после проигрывания не совпадает пикселей: {wrong}")
+    return problems
+
+
+def _load(path: str) -> np.ndarray:
+    return np.asarray(Image.open(path).convert("RGB"))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Журнал обменов пикселей")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    replay = sub.add_parser("replay", help="применить журнал к картинкам")
+    replay.add_argument("log")
+    replay.add_argument("source")
+    replay.add_argument("canvas")
+    replay.add_argument("-o", "--output", default="result.png")
+
+    verify = sub.add_parser("verify", help="проверить, что журнал собирает исходную картинку")
+    verify.add_argument("log")
+    verify.add_argument("source")
+    verify.add_argument("canvas")
+    verify.add_argument("--key", help="HEX-ключ для сверки с хэшем в журнале")
+
+    args = parser.parse_args(argv)
+    try:
+        return _run(args)
+    except (OSError, ValueError) as e:
+        # Не журнал, обрезанный файл, нечитаемая картинка, кривой ключ
+        print("Ошибка:", e)
+        return 1
+
+
+def _run(args):
+    info, src_log, dst_log = read_swap_log(args.log)
+    source, canvas = _load(args.source), _load(args.canvas)
+
+    if args.command == "replay":
+        _, B = replay_log(info, src_log, dst_log, source, canvas)
+        Image.fromarray(B).save(args.output)
+        print(f"Шагов: {info['steps']}. Результат: {args.output}")
+        return 0
+
+    key = bytes.fromhex(args.key) if args.key else None
+    problems = verify_log(info, src_log, dst_log, source, canvas, key)
+    for problem in problems:
+        print("Ошибка:", problem)
+    if not problems:
+        print(f"Журнал корректен: {info['steps']} шагов, {info['width']}×{info['height']}")
+    return 1 if problems else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,42 +1,7 @@
 import numpy as np
 import matplotlib.pyplot as plt
-import random
-
-
-# Функция для генерации случайного пути
-def generate_random_path(start, end, max_steps=100):
-    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Вверх, вниз, влево, вправо
-    path = [start]
-    current = start
-
-    for _ in range(max_steps):
-        possible_moves = []
-        for d in directions:
-            next_pos = (current[0] + d[0], current[1] + d[1])
-            # Проверяем границы и отсутствие возврата назад
-            if (0 <= next_pos[0] < 20 and 0 <= next_pos[1] < 20 and
-                    (len(path) < 2 or next_pos != path[-2])):
-                possible_moves.append(d)
-        if not possible_moves:
-            break
-        move = random.choice(possible_moves)
-        current = (current[0] + move[0], current[1] + move[1])
-        path.append(current)
-        if current == end:
-            return path
-    return None  # Путь не достиг цели
-
-
-# Функция для поиска путей методом Монте-Карло
-def monte_carlo_path_search(start, end, num_simulations):
-    paths = []
-    for sim in range(num_simulations):
-        path = generate_random_path(start, end)
-        if path:
-            paths.append(path)
-        if sim % 100 == 0:
-            print(f'Прошло {sim} итераций')
-    return paths
+from grid_graph import GridGraph
+from mc_driver import parallel_path_search
 
 
 # Функция для визуализации кратчайшего пути
@@ -60,19 +25,26 @@ def visualize_shortest_path(n, shortest_path):
     plt.show()
 
 
-# Параметры
-n = 20
-start_coords = (2, 7)  # Начальная точка
-end_coords = (8, 17)  # Конечная точка
-num_simulations = 1000  # Количество симуляций
-
-# Запуск Монте-Карло
-paths = monte_carlo_path_search(start_coords, end_coords, num_simulations)
-
-# Проверка результатов
-if not paths:
-    print("Пути не найдены. Попробуйте увеличить количество симуляций.")
-else:
-    shortest_path = min(paths, key=len)
-    print(f'Длина кратчайшего пути: {len(shortest_path) - 1} шагов')
-    visualize_shortest_path(n, shortest_path)
\ No newline at end of file
+if __name__ == '__main__':
+    # Параметры
+    n = 20
+    start_coords = (2, 7)  # Начальная точка
+    end_coords = (8, 17)  # Конечная точка
+    num_simulations = 1000  # Количество симуляций
+    seed = 2024  # Зерно: при одном seed результат не зависит от числа процессов
+
+    # Запуск Монте-Карло на всех ядрах (блуждание без возврата, не больше 100 шагов)
+    graph = GridGraph(n)
+    start = graph.index(*start_coords)
+    end = graph.index(*end_coords)
+    shortest, histogram = parallel_path_search(graph, start, end, num_simulations, seed=seed,
+                                               non_backtracking=True, max_steps=100)
+    print(f'Найдено путей: {histogram.sum()} из {num_simulations}')
+
+    # Проверка результатов
+    if shortest is None:
+        print("Пути не найдены. Попробуйте увеличить количество симуляций.")
+    else:
+        shortest_path = [divmod(node, n) for node in shortest]
+        print(f'Длина кратчайшего пути: {len(shortest_path) - 1} шагов')
+        visualize_shortest_path(n, shortest_path)
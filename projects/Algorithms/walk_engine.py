@@ -0,0 +1,147 @@
+import numpy as np
+
+from walk_stats import PathStats
+
+
+# Синхронные шаги пачки блуждающих. После каждого шага отдаёт
+# (номер шага, индексы сдвинувшихся блуждающих, их новые позиции, все позиции);
+# lengths заполняется длинами путей по мере выбывания (-1 — не дошёл).
+def _advance(neighbors, degree, start, end, lengths, rng, max_steps, non_backtracking):
+    size = len(lengths)
+    pos = np.full(size, start, dtype=np.int32)
+    prev = np.full(size, -1, dtype=np.int32)
+    active = np.arange(size)
+
+    if start == end:
+        lengths[:] = 0
+        return
+
+    step = 0
+    while active.size and (max_steps is None or step < max_steps):
+        cur = pos[active]
+        deg = degree[cur]
+        if non_backtracking:
+            # Без возврата: выбираем среди deg - 1 соседей, тупики выбывают без пути
+            back = prev[active]
+            choices = deg - (back >= 0)
+            alive = choices > 0
+            if not alive.all():
+                active, cur, deg, back, choices = (
+                    active[alive], cur[alive], deg[alive], back[alive], choices[alive])
+                if not active.size:
+                    break
+        else:
+            choices = deg
+
+        step += 1
+        # Один вызов генератора на весь шаг: номер соседа равномерно среди choices
+        choice = (rng.random(active.size) * choices).astype(np.int32)
+        nxt = neighbors[cur, choice]
+        if non_backtracking:
+            # Попали в предыдущую вершину — берём последнего соседа вместо неё
+            hit = nxt == back
+            nxt[hit] = neighbors[cur[hit], deg[hit] - 1]
+            prev[active] = cur
+        pos[active] = nxt
+        yield step, active, nxt, pos
+
+        # Дошедшие до конца выбывают
+        done = nxt == end
+        lengths[active[done]] = step
+        active = active[~done]
+
+
+# Одна пачка блуждающих, которые идут одновременно (по шагу за итерацию)
+def _walk_batch(neighbors, degree, start, end, size, rng, store_paths, max_steps,
+                non_backtracking=False):
+    lengths = np.full(size, -1, dtype=np.int64)
+
+    history = None
+    if store_paths:
+        history = np.empty((64, size), dtype=np.int32)
+        history[0] = start
+
+    for step, _, _, pos in _advance(neighbors, degree, start, end, lengths, rng,
+                                    max_steps, non_backtracking):
+        if store_paths:
+            if step == len(history):
+                history = np.concatenate((history, np.empty_like(history)))
+            history[step] = pos
+
+    if not store_paths:
+        return lengths, None
+    paths = [history[:length + 1, w].tolist() for w, length in enumerate(lengths) if length >= 0]
+    return lengths, paths
+
+
+# Повтор первых steps шагов пачки с сохранённого состояния генератора,
+# записывается путь только одного блуждающего walker
+def _replay_path(neighbors, degree, start, end, size, state, walker, steps, non_backtracking):
+    rng = np.random.Generator(getattr(np.random, state["bit_generator"])())
+    rng.bit_generator.state = state
+    lengths = np.full(size, -1, dtype=np.int64)
+    path = [start]
+    for _, _, _, pos in _advance(neighbors, degree, start, end, lengths, rng,
+                                 steps, non_backtracking):
+        path.append(int(pos[walker]))
+    return path
+
+
+# Пакетное случайное блуждание: тысячи блуждающих двигаются синхронно как массивы NumPy.
+# store_paths=True — список путей (совместим с visualize_shortest_path),
+# store_paths=False — только массив длин путей (-1, если за max_steps конец не достигнут).
+# non_backtracking=True — блуждание без возврата в предыдущую вершину.
+def batched_random_walk(graph, start, end, num_sim, batch_size=1000, store_paths=True,
+                        max_steps=None, rng=None, non_backtracking=False):
+    neighbors, degree = graph.neighbors, graph.degree
+    if degree[start] == 0:
+        raise ValueError("У начальной вершины нет соседей")
+    rng = np.random.default_rng(rng)
+
+    all_lengths = []
+    all_paths = []
+    for first in range(0, num_sim, batch_size):
+        size = min(batch_size, num_sim - first)
+        lengths, paths = _walk_batch(neighbors, degree, start, end, size, rng,
+                                     store_paths, max_steps, non_backtracking)
+        all_lengths.append(lengths)
+        if store_paths:
+            all_paths.extend(paths)
+
+    if store_paths:
+        return all_paths
+    return np.concatenate(all_lengths) if all_lengths else np.zeros(0, dtype=np.int64)
+
+
+# Потоковый прогон: пути не хранятся, всё сводится в PathStats (память не растёт с num_sim).
+# Кратчайший путь пачки восстанавливается повтором её первых шагов с того же состояния
+# генератора, и только если он короче уже найденного.
+def stream_random_walks(graph, start, end, num_sim, stats=None, batch_size=10000,
+                        max_steps=None, rng=None, non_backtracking=False, count_visits=True):
+    neighbors, degree = graph.neighbors, graph.degree
+    if degree[start] == 0:
+        raise ValueError("У начальной вершины нет соседей")
+    rng = np.random.default_rng(rng)
+    if stats is None:
+        stats = PathStats(graph.size)
+
+    for first in range(0, num_sim, batch_size):
+        size = min(batch_size, num_sim - first)
+        state = rng.bit_generator.state
+        lengths = np.full(size, -1, dtype=np.int64)
+        if count_visits:
+            stats.add_visits(np.full(size, start, dtype=np.int32))
+        for _, _, nxt, _ in _advance(neighbors, degree, start, end, lengths, rng,
+                                     max_steps, non_backtracking):
+            if count_visits:
+                stats.add_visits(nxt)
+        stats.add_lengths(lengths)
+
+        finished = np.flatnonzero(lengths >= 0)
+        if finished.size:
+            walker = finished[np.argmin(lengths[finished])]
+            best = stats.shortest_path
+            if best is None or lengths[walker] < len(best) - 1:
+                stats.offer_path(_replay_path(neighbors, degree, start, end, size, state,
+                                              walker, int(lengths[walker]), non_backtracking))
+    return stats
@@ -0,0 +1,98 @@
+import numpy as np
+
+
+# Потоковая статистика по блужданиям в фиксированной памяти:
+# лучший (кратчайший) путь, гистограмма длин, среднее/дисперсия и посещения клеток.
+# Сами пути не хранятся, поэтому число блужданий ограничено только временем.
+class PathStats:
+    _FLUSH = 1 << 20  # сколько позиций копим перед одним bincount
+
+    def __init__(self, size):
+        self.size = size
+        self.count = 0  # дошедшие до конца
+        self.failures = 0  # не дошедшие за max_steps или упёршиеся в тупик
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.histogram = np.zeros(0, dtype=np.int64)
+        self.shortest_path = None
+        self._visits = np.zeros(size, dtype=np.int64)
+        self._pending = []
+        self._pending_size = 0
+
+    # Длины путей пачки (-1 — блуждание не дошло)
+    def add_lengths(self, lengths):
+        lengths = np.asarray(lengths)
+        finished = lengths[lengths >= 0]
+        self.failures += len(lengths) - len(finished)
+        if not finished.size:
+            return
+        # Объединение моментов по формуле Чана
+        n_b = finished.size
+        mean_b = finished.mean()
+        m2_b = ((finished - mean_b) ** 2).sum()
+        total = self.count + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / total
+        self._m2 += m2_b + delta ** 2 * self.count * n_b / total
+        self.count = total
+        self._add_histogram(np.bincount(finished))
+
+    # Клетки, в которых побывали блуждающие (массив индексов, повторы допустимы)
+    def add_visits(self, nodes):
+        self._pending.append(np.asarray(nodes))
+        self._pending_size += len(nodes)
+        if self._pending_size >= self._FLUSH:
+            self._flush()
+
+    def offer_path(self, path):
+        if path is not None and (self.shortest_path is None or len(path) < len(self.shortest_path)):
+            self.shortest_path = path
+
+    # Слияние со статистикой другого потока (например, другого процесса)
+    def merge(self, other):
+        if other.count:
+            total = self.count + other.count
+            delta = other.mean - self.mean
+            self.mean += delta * other.count / total
+            self._m2 += other._m2 + delta ** 2 * self.count * other.count / total
+            self.count = total
+        self.failures += other.failures
+        self._add_histogram(other.histogram)
+        self._visits += other.visits
+        self.offer_path(other.shortest_path)
+        return self
+
+    @property
+    def min_length(self):
+        nonzero = np.flatnonzero(self.histogram)
+        return int(nonzero[0]) if nonzero.size else None
+
+    @property
+    def variance(self):
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self):
+        return np.sqrt(self.variance)
+
+    @property
+    def visits(self):
+        self._flush()
+        return self._visits
+
+    def _add_histogram(self, hist):
+        if len(hist) > len(self.histogram):
+            self.histogram = np.concatenate(
+                (self.histogram, np.zeros(len(hist) - len(self.histogram), dtype=np.int64)))
+        self.histogram[:len(hist)] += hist
+
+    def _flush(self):
+        if self._pending:
+            self._visits += np.bincount(np.concatenate(self._pending), minlength=self.size)
+            self._pending = []
+            self._pending_size = 0
+
+    # Состояние для передачи между процессами без накопленного буфера
+    def __getstate__(self):
+        self._flush()
+        return self.__dict__.copy()
@@ -2,40 +2,101 @@ import numpy as np
 from tabulate import tabulate
 
 
-def lu(A, b):
-    n = len(A)
-    L = np.zeros((n, n))
-    U = np.zeros((n, n))
-    y = np.zeros_like(b)
-
-
-    for i in range(n):
-        # Заполнение верхней треугольной матрицы U
-        for k in range(i, n):
-            sum_upper = sum(L[i][j] * U[j][k] for j in range(i))
-            U[i][k] = A[i][k] - sum_upper  # Элемент матрицы U
-
-        L[i][i] = 1  # Диагональные элементы матрицы L равны 1
-        # Заполнение нижней треугольной матрицы L
-        for k in range(i + 1, n):
-            sum_lower = sum(L[k][j] * U[j][i] for j in range(i))
-            L[k][i] = (A[k][i] - sum_lower) / U[i][i]  # Элемент матрицы L
+# Разложение PA = LU (Дулиттл, выбор ведущего по столбцу) по блокам столбцов.
+# L и U хранятся в одной матрице LU, перестановка строк — в perm.
+class LUFactorization:
+    def __init__(self, A, block=64):
+        LU = np.array(A, dtype=float)
+        n = len(LU)
+        if LU.shape != (n, n):
+            raise ValueError("Матрица должна быть квадратной")
+        self.n, self.block = n, block
+        self.perm = np.arange(n)
+
+        for k0 in range(0, n, block):
+            k1 = min(k0 + block, n)
+            # Панель столбцов k0:k1 — построчно векторизованный Дулиттл с выбором ведущего
+            for k in range(k0, k1):
+                p = k + int(np.argmax(np.abs(LU[k:, k])))
+                if LU[p, k] == 0:
+                    raise ValueError("Матрица вырождена")
+                if p != k:
+                    LU[[k, p]] = LU[[p, k]]
+                    self.perm[[k, p]] = self.perm[[p, k]]
+                LU[k + 1:, k] /= LU[k, k]
+                LU[k + 1:, k + 1:k1] -= np.outer(LU[k + 1:, k], LU[k, k + 1:k1])
+            if k1 == n:
+                break
+            # Строки U правее панели: L11 · U12 = A12
+            _forward(LU[k0:k1, k0:k1], LU[k0:k1, k1:])
+            # Хвост обновляется одним матричным произведением
+            LU[k1:, k1:] -= LU[k1:, k0:k1] @ LU[k0:k1, k1:]
+        self.LU = LU
+
+    @property
+    def L(self):
+        return np.tril(self.LU, -1) + np.eye(self.n)
+
+    @property
+    def U(self):
+        return np.triu(self.LU)
+
+    def det(self):
+        sign = _permutation_sign(self.perm)
+        return sign * np.prod(np.diag(self.LU))
+
+    # Решение AX = B для вектора или сразу для нескольких столбцов B
+    def solve(self, B):
+        X = np.array(B, dtype=float)[self.perm]
+        vector = X.ndim == 1
+        if vector:
+            X = X[:, None]
+        block = self.block
+        # Прямой ход по блокам: Ly = Pb
+        for k0 in range(0, self.n, block):
+            k1 = min(k0 + block, self.n)
+            X[k0:k1] -= self.LU[k0:k1, :k0] @ X[:k0]
+            _forward(self.LU[k0:k1, k0:k1], X[k0:k1])
+        # Обратный ход по блокам: Ux = y
+        for k1 in range(self.n, 0, -block):
+            k0 = max(k1 - block, 0)
+            X[k0:k1] -= self.LU[k0:k1, k1:] @ X[k1:]
+            _backward(self.LU[k0:k1, k0:k1], X[k0:k1])
+        return X[:, 0] if vector else X
+
+
+# X ← L⁻¹X на месте, L — нижнетреугольная с единицами на диагонали
+def _forward(L, X):
+    for i in range(1, len(L)):
+        X[i] -= L[i, :i] @ X[:i]
+
+
+# X ← U⁻¹X на месте, U — верхнетреугольная
+def _backward(U, X):
+    for i in reversed(range(len(U))):
+        X[i] -= U[i, i + 1:] @ X[i + 1:]
+        X[i] /= U[i, i]
+
+
+def _permutation_sign(perm):
+    seen = np.zeros(len(perm), dtype=bool)
+    sign = 1
+    for i in range(len(perm)):
+        if not seen[i]:
+            j, length = i, 0
+            while not seen[j]:
+                seen[j] = True
+                j = perm[j]
+                length += 1
+            if length % 2 == 0:
+                sign = -sign
+    return sign
 
-    print(tabulate(L), tabulate(U))
 
-    # Прямой ход метода решения
-    for i in range(n):
-        sum_forward = sum(L[i][j] * y[j] for j in range(i))
-        y[i] = b[i] - sum_forward
-
-    x = np.zeros_like(y)
-
-    # Обратный ход метода решения
-    for i in reversed(range(n)):
-        sum_backward = sum(U[i][j] * x[j] for j in range(i + 1, n))
-        x[i] = (y[i] - sum_backward) / U[i][i]  
-
-    return x
+def lu(A, b):
+    factorization = LUFactorization(A)
+    print(tabulate(factorization.L), tabulate(factorization.U))
+    return factorization.solve(b)
 
 def main():
     A1 = np.array([
@@ -1,34 +1,75 @@
 import numpy as np
 
 
+# Разложение A = QR отражениями Хаусхолдера (m ≥ n): R на диагонали и выше,
+# векторы отражений v_k — под диагональью, сами матрицы отражений не строятся
+class HouseholderQR:
+    def __init__(self, A):
+        QR = np.array(A, dtype=float)
+        m, n = QR.shape
+        if m < n:
+            raise ValueError("Строк должно быть не меньше, чем столбцов")
+        self.m, self.n = m, n
+        self.tau = np.zeros(n)
+
+        for k in range(min(m - 1, n)):
+            a = QR[k:, k]
+            norm = np.linalg.norm(a)
+            if norm == 0:
+                continue
+            # beta — новый диагональный элемент, знак выбран против вычитания близких чисел
+            beta = -norm if a[0] >= 0 else norm
+            self.tau[k] = (beta - a[0]) / beta
+            a[1:] /= a[0] - beta
+            a[0] = beta
+            v = np.concatenate(([1.0], a[1:]))
+            tail = QR[k:, k + 1:]
+            tail -= np.outer(v, self.tau[k] * (v @ tail))
+        self.QR = QR
+
+    @property
+    def R(self):
+        return np.triu(self.QR[:self.n])
+
+    def _reflect(self, X, order):
+        for k in order:
+            if self.tau[k]:
+                v = np.concatenate(([1.0], self.QR[k + 1:, k]))
+                X[k:] -= np.outer(v, self.tau[k] * (v @ X[k:]))
+
+    # Qᵀ B без построения Q
+    def apply_qt(self, B):
+        X = np.array(B, dtype=float)
+        vector = X.ndim == 1
+        if vector:
+            X = X[:, None]
+        self._reflect(X, range(self.n))
+        return X[:, 0] if vector else X
+
+    # Q B без построения Q
+    def apply_q(self, B):
+        X = np.array(B, dtype=float)
+        vector = X.ndim == 1
+        if vector:
+            X = X[:, None]
+        self._reflect(X, reversed(range(self.n)))
+        return X[:, 0] if vector else X
+
+    # Решение Ax = b, при m > n — задача наименьших квадратов
+    def solve(self, b):
+        y = self.apply_qt(b)[:self.n]
+        x = np.zeros_like(y)
+        R = self.QR
+        # Обратный ход по верхнетреугольной R
+        for i in range(self.n - 1, -1, -1):
+            if R[i, i] == 0:
+                raise ValueError("Матрица вырождена")
+            x[i] = (y[i] - R[i, i + 1:self.n] @ x[i + 1:]) / R[i, i]
+        return x
+
+
 def qr(A, b):
-    n = A.shape[0]
-    R = A.copy()
-    Q = np.eye(n)
-
-    for k in range(n - 1):
-        # Определяем вектор нормали p^(k) без нормализации
-        a = R[k:, k]
-        sigma_k = -1 if a[0] < 0 else 1
-        p_k = np.zeros_like(a)
-        p_k[0] = a[0] + sigma_k * np.linalg.norm(a)
-        p_k[1:] = a[1:]
-
-        # Вычисляем матрицу отражения P_k
-        P_k = np.eye(n)
-        P_k[k:, k:] -= 2 * np.outer(p_k, p_k) / np.dot(p_k, p_k)
-
-        # Применяем отражение к матрице R и вектору b
-        R = P_k @ R
-        Q = Q @ P_k
-        b = P_k @ b
-
-    # Теперь решаем систему Rx = Q^T b, где R - верхнетреугольная
-    x = np.zeros(n)
-    for i in range(n - 1, -1, -1):
-        x[i] = (b[i] - np.dot(R[i, i + 1:], x[i + 1:])) / R[i, i]
-
-    return x
+    return HouseholderQR(A).solve(b)
 
 
 def main():
@@ -1,85 +1,219 @@
 import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.csgraph import breadth_first_order
 
 
-def sor_method(A, b, w, tol=1e-6, max_iter=10000):
-    n = len(A)
-    x = np.zeros(n)  # Начальное приближение
-    x_new = x.copy()
+# SOR по строкам CSR (при w = 1 — Гаусс-Зейдель), x обновляется на месте
+def sor_method(A, b, w, tol=1e-6, max_iter=10000, x0=None):
+    A = sp.csr_matrix(A)
+    n = A.shape[0]
+    b = np.asarray(b, dtype=float)
+    x = np.zeros(n) if x0 is None else np.array(x0, dtype=float)
+
+    # Строки CSR в списках Python: на скалярном обходе это быстрее индексации NumPy
+    indptr, indices, data = A.indptr.tolist(), A.indices.tolist(), A.data.tolist()
+    diag = A.diagonal().tolist()
+    bl = b.tolist()
+    xl = x.tolist()
 
     for iteration in range(1, max_iter + 1):
-        x_new = x.copy()
+        change = 0.0
         for i in range(n):
-            # Сумма для индексов j < i (используем x_new) и j > i (используем x)
-            sigma = np.dot(A[i, :i], x_new[:i]) + np.dot(A[i, i + 1:], x[i + 1:])
-            x_new[i] = (1 - w) * x[i] + (w / A[i, i]) * (b[i] - sigma)
+            sigma = 0.0
+            for k in range(indptr[i], indptr[i + 1]):
+                sigma += data[k] * xl[indices[k]]
+            # sigma включает диагональ, поэтому (1 - w)x + w(b - σ')/d = x + w(b - sigma)/d
+            new = xl[i] + w * (bl[i] - sigma) / diag[i]
+            change += (new - xl[i]) ** 2
+            xl[i] = new
 
         # Проверка на сходимость
-        if np.linalg.norm(x_new - x, ord=2) < tol:
-            return x_new, iteration
-
-        x = x_new.copy()
-
-    return x_new, max_iter
-
-
+        if change ** 0.5 < tol:
+            return np.array(xl), iteration
+
+    return np.array(xl), max_iter
+
+
+# Спектральный радиус матрицы Якоби I - D⁻¹A степенным методом;
+# отношение норм берётся через два шага: собственные числа идут парами ±μ
+def jacobi_spectral_radius(A, max_iter=500, tol=1e-8, seed=0):
+    A = sp.csr_matrix(A)
+    inv_diag = 1.0 / A.diagonal()
+    x = np.random.default_rng(seed).random(A.shape[0])
+    x /= np.linalg.norm(x)
+    rho = 0.0
+    for _ in range(max_iter):
+        y = x - inv_diag * (A @ x)
+        y = y - inv_diag * (A @ y)
+        norm = np.linalg.norm(y)
+        if norm == 0:
+            return 0.0
+        new_rho = np.sqrt(norm)
+        x = y / norm
+        if abs(new_rho - rho) < tol:
+            return new_rho
+        rho = new_rho
+    return rho
+
+
+# ω = 2 / (1 + √(1 - ρ²)) по теореме Юнга
+def optimal_omega(A, **kwargs):
+    rho = jacobi_spectral_radius(A, **kwargs)
+    if rho >= 1:
+        raise ValueError("Метод Якоби расходится (ρ ≥ 1): оптимальный ω не определён")
+    return 2 / (1 + np.sqrt(1 - rho ** 2))
+
+
+# Раскраска неизвестных в два цвета без связей внутри цвета (True — красный)
+def red_black_coloring(A):
+    A = sp.csr_matrix(A)
+    graph = A - sp.diags(A.diagonal())
+    graph.eliminate_zeros()
+    n = A.shape[0]
+    color = np.zeros(n, dtype=bool)
+    visited = np.zeros(n, dtype=bool)
+    for root in range(n):
+        if visited[root]:
+            continue
+        order, pred = breadth_first_order(graph, root, directed=False)
+        visited[order] = True
+        # В порядке обхода предок раскрашен раньше потомка
+        for v in order[1:].tolist():
+            color[v] = not color[pred[v]]
+    if _same_color_coupled(A, color):
+        raise ValueError("Граф матрицы не двудольный: красно-чёрное упорядочение невозможно")
+    return color
+
+
+# Связаны ли внедиагональным элементом неизвестные одного цвета
+def _same_color_coupled(A, color):
+    coo = sp.coo_matrix(A)
+    off = (coo.row != coo.col) & (coo.data != 0)
+    return bool(np.any(color[coo.row[off]] == color[coo.col[off]]))
+
+
+# SOR в красно-чёрном порядке: половина прохода — одно векторное обновление
+def red_black_sor(A, b, w, tol=1e-6, max_iter=10000, x0=None, red=None):
+    A = sp.csr_matrix(A)
+    b = np.asarray(b, dtype=float)
+    if red is None:
+        red = red_black_coloring(A)
+    else:
+        red = np.asarray(red, dtype=bool)
+        if red.shape != (A.shape[0],):
+            raise ValueError("Маска red должна иметь по элементу на неизвестную")
+        if _same_color_coupled(A, red):
+            raise ValueError("Маска red связывает неизвестные одного цвета: красно-чёрный SOR неприменим")
+    R, B = np.flatnonzero(red), np.flatnonzero(~red)
+    diag = A.diagonal()
+    # Внутри цвета неизвестные не связаны, поэтому нужны только блоки «красный ← чёрный» и обратно
+    A_rb, A_br = A[R][:, B], A[B][:, R]
+    b_r, b_b = b[R], b[B]
+    d_r, d_b = diag[R], diag[B]
+
+    x = np.zeros(A.shape[0]) if x0 is None else np.array(x0, dtype=float)
+    x_r, x_b = x[R], x[B]
+    for iteration in range(1, max_iter + 1):
+        old_r, old_b = x_r.copy(), x_b.copy()
+        x_r *= 1 - w
+        x_r += w * (b_r - A_rb @ x_b) / d_r
+        x_b *= 1 - w
+        x_b += w * (b_b - A_br @ x_r) / d_b
+        change = np.sqrt(np.sum((x_r - old_r) ** 2) + np.sum((x_b - old_b) ** 2))
+        if change < tol:
+            break
+    x[R], x[B] = x_r, x_b
+    return x, iteration
+
+
+# Пятиточечный лапласиан на сетке m×m (CSR)
+def poisson_2d(m):
+    T = sp.diags([-1.0, 4.0, -1.0], [-1, 0, 1], shape=(m, m))
+    S = sp.diags([-1.0, -1.0], [-1, 1], shape=(m, m))
+    return (sp.kron(sp.identity(m), T) + sp.kron(S, sp.identity(m))).tocsr()
+
+
+# Простая итерация (Якоби) по копии M = D⁻¹A с нулевой диагональю;
+# b может быть матрицей (n, k) — k правых частей сразу
 def simple(A, b, tol=1e-15, max_iter=10000):
-    for i in range(A.shape[0]):
-        factor = A[i, i]
-        A[i, :] /= factor
-        b[i] /= factor
-
-    x = np.zeros_like(b)
+    inv_diag = 1.0 / (A.diagonal() if sp.issparse(A) else np.diag(A))
+    if sp.issparse(A):
+        M = sp.csr_matrix(sp.diags(inv_diag) @ A)
+        M.setdiag(0)
+        M.eliminate_zeros()
+    else:
+        M = np.asarray(A, dtype=float) * inv_diag[:, None]
+        np.fill_diagonal(M, 0)
+    b = np.asarray(b, dtype=float)
+    c = b * inv_diag if b.ndim == 1 else b * inv_diag[:, None]
+
+    x = np.zeros_like(c)
+    next_solution = np.empty_like(c)
 
     for iteration in range(max_iter):
-        next_solution = np.zeros_like(x)
-
-        for i in range(len(b)):
-            residual = b[i] - np.dot(A[i, :], x)
-            next_solution[i] = residual + A[i, i] * x[i]
+        if sp.issparse(M):
+            next_solution[...] = M @ x
+        else:
+            np.matmul(M, x, out=next_solution)
+        np.subtract(c, next_solution, out=next_solution)
 
         if np.max(np.abs(next_solution - x)) < tol:
             return next_solution, iteration + 1
 
-        x = next_solution
+        x, next_solution = next_solution, x
 
     return None, max_iter
 
 
-# Матрицы A и вектор b
-# Пример изначальной матрицы
-# A = np.array([
-#     [10.9, 1.2, 2.1, 0.9],
-#     [1.2, 11.2, 1.5, 2.5],
-#     [2.1, 1.5, 9.8, 1.3],
-#     [0.9, 2.5, 1.3, 12.1]
-# ])
-#
-# b = np.array([-7.0, 5.3, 10.3, 24.6])
+def main():
+    # Матрицы A и вектор b
+    # Пример изначальной матрицы
+    # A = np.array([
+    #     [10.9, 1.2, 2.1, 0.9],
+    #     [1.2, 11.2, 1.5, 2.5],
+    #     [2.1, 1.5, 9.8, 1.3],
+    #     [0.9, 2.5, 1.3, 12.1]
+    # ])
+    #
+    # b = np.array([-7.0, 5.3, 10.3, 24.6])
+
+    A = np.array([
+        [3.82, 1.02, 0.75, 0.81],
+        [1.05, 4.53, 0.98, 1.53],
+        [0.73, 0.85, 4.71, 0.81],
+        [0.88, 0.81, 1.28, 3.50]
+    ])
+
+    b = np.array([15.655, 22.705, 23.480, 16.110])
+
+    # Значения w для сравнения в методе SOR
+    w_values = [0.01, 0.5, 1, 1.5, 1.99]
+    sor_results = []
+
+    for w in w_values:
+        sor_solution, sor_iterations = sor_method(A, b, w)
+        sor_results.append((w, sor_iterations, sor_solution))
+
+    simple_solution, simple_iterations = simple(A, b)
+
+    print(f"{'Метод':<15} {'w':<6} {'Итерации':<12} {'Решение'}")
+    print("-" * 60)
+    for w, iters, sol in sor_results:
+        print(f"{'SOR':<12} {w:<6} {iters:<12} {np.round(sol, 6)}")
+    print(f"{'Простая итерация':<12} {'-':<6} {simple_iterations:<12} {np.round(simple_solution, 6)}")
+
+    # Большая система: двумерное уравнение Пуассона
+    m = 64
+    P = poisson_2d(m)
+    rhs = np.ones(m * m)
+    w_opt = optimal_omega(P)
+    print()
+    print(f"Пуассон {m}×{m}: оптимальный w = {w_opt:.4f}")
+    for w in (1.0, w_opt):
+        solution, iters = red_black_sor(P, rhs, w)
+        residual = np.linalg.norm(rhs - P @ solution)
+        print(f"{'SOR (красно-чёрный)':<20} {w:<8.4f} {iters:<8} невязка {residual:.2e}")
 
-A = np.array([
-    [3.82, 1.02, 0.75, 0.81],
-    [1.05, 4.53, 0.98, 1.53],
-    [0.73, 0.85, 4.71, 0.81],
-    [0.88, 0.81, 1.28, 3.50]
-])
-
-b = np.array([15.655, 22.705, 23.480, 16.110])
-
-# Значения w для сравнения в методе SOR
-w_values = [0.01, 0.5, 1, 1.5, 1.99]
-sor_results = []
-
-for w in w_values:
-    sor_solution, sor_iterations = sor_method(A, b, w)
-    sor_results.append((w, sor_iterations, sor_solution))
-
-simple_solution, simple_iterations = simple(A, b)
-
-print(f"{'Метод':<15} {'w':<6} {'Итерации':<12} {'Решение'}")
-print("-" * 60)
-for w, iters, sol in sor_results:
-    print(f"{'SOR':<12} {w:<6} {iters:<12} {np.round(sol, 6)}")
-print(f"{'Простая итерация':<12} {'-':<6} {simple_iterations:<12} {np.round(simple_solution, 6)}")
 
 """
 При w → 0: Метод нижней релаксации (подрелаксации). Здесь обновления переменных происходят очень медленно, 
@@ -92,3 +226,7 @@ print(f"{'Простая итерация':<12} {'-':<6} {simple_iterations:<12}
 
 Метод простой итерации (Якоби) можно рассматривать как метод без релаксации.
 """
+
+
+if __name__ == '__main__':
+    main()
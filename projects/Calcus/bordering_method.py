@@ -1,38 +1,77 @@
 import numpy as np
 from tabulate import tabulate
 
-def get_inv(A):
-    n = len(A)
-    A_inv = np.zeros(A.shape)
+# Обратная матрица, наращиваемая окаймлением: append пересчитывает
+# обратную к A_(k+1) за O(k²) в заранее выделенном буфере
+class BorderedInverse:
+    # Известную обратную к A можно передать в inverse, иначе она строится
+    # окаймлением за O(n³) (все главные миноры A должны быть невырождены)
+    def __init__(self, A=None, capacity=16, inverse=None):
+        A = np.zeros((0, 0)) if A is None else np.asarray(A, dtype=float)
+        n = len(A)
+        capacity = max(capacity, n, 1)
+        self._matrix = np.zeros((capacity, capacity))
+        self._inv = np.zeros((capacity, capacity))
+        self.size = 0
+        if inverse is not None:
+            inverse = np.asarray(inverse, dtype=float)
+            if A.shape != (n, n) or inverse.shape != (n, n):
+                raise ValueError("A и inverse должны быть квадратными матрицами одного размера")
+            self._matrix[:n, :n] = A
+            self._inv[:n, :n] = inverse
+            self.size = n
+            return
+        for i in range(n):
+            self.append(A[:i, i], A[i, :i], A[i, i])
+
+    @property
+    def matrix(self):
+        return self._matrix[:self.size, :self.size]
 
-    for i in range(n):
-        A_i = A[:i+1, :i+1]
-        if i == 0:
-            A_inv = np.array([[1 / A_i[0, 0]]], dtype=float)
-        else:
-            # Разбиваем матрицу на блоки
-            A11 = A_inv
-            a12 = A[:i, i:i+1]
-            a21 = A[i:i+1, :i]
-            alpha = A[i, i]
+    @property
+    def inverse(self):
+        return self._inv[:self.size, :self.size]
 
+    def _grow(self):
+        capacity = 2 * len(self._inv)
+        for name in ("_matrix", "_inv"):
+            old = getattr(self, name)
+            new = np.zeros((capacity, capacity))
+            new[:self.size, :self.size] = old[:self.size, :self.size]
+            setattr(self, name, new)
 
-            S = alpha - (a21 @ A11 @ a12)[0, 0]
+    # column — новый столбец над диагональю, row — новая строка слева от неё
+    def append(self, column, row, alpha):
+        k = self.size
+        if k == len(self._inv):
+            self._grow()
+        a12 = np.asarray(column, dtype=float).reshape(k)
+        a21 = np.asarray(row, dtype=float).reshape(k)
+        A11 = self._inv[:k, :k]
 
-            # Вычисляем блоки обратной матрицы
-            B11_new = A11 + (A11 @ a12 @ a21 @ A11) / S
-            b12_new = -(A11 @ a12) / S
-            b21_new = -(a21 @ A11) / S
-            beta_new = np.array([[1 / S]])
+        # A11 @ a12 и a21 @ A11 считаются один раз и дальше входят во все блоки
+        u = A11 @ a12
+        v = a21 @ A11
+        S = alpha - a21 @ u
+        if S == 0:
+            raise ValueError(f"Главный минор порядка {k + 1} вырожден: окаймление невозможно")
 
-            # Собираем итоговую матрицу
-            top = np.hstack((B11_new, b12_new))
-            bottom = np.hstack((b21_new, beta_new))
-            A_inv = np.vstack((top, bottom))
+        # Блоки обратной матрицы пишутся на место, B11 = A11 + u vᵀ / S
+        A11 += np.outer(u, v / S)
+        self._inv[:k, k] = -u / S
+        self._inv[k, :k] = -v / S
+        self._inv[k, k] = 1 / S
 
-    return A_inv
+        self._matrix[:k, k] = a12
+        self._matrix[k, :k] = a21
+        self._matrix[k, k] = alpha
+        self.size = k + 1
 
 
+def get_inv(A):
+    A = np.asarray(A, dtype=float)
+    return BorderedInverse(A, capacity=len(A)).inverse.copy()
+
 
 def main():
     A = np.array([
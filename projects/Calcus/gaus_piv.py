@@ -0,0 +1,18 @@
+import numpy as np
+
+from LU import LUFactorization
+
+
+# Метод Гаусса с выбором главного элемента по столбцу.
+# Прямой ход — это разложение PA = LU: оно считается один раз (gauss_piv_factor),
+# после чего каждая правая часть решается двумя треугольными ходами за O(n²).
+def gauss_piv_factor(A):
+    return LUFactorization(np.asarray(A, dtype=float))
+
+
+def gauss_piv_solve(factorization, b):
+    return factorization.solve(b)
+
+
+def gauss_piv(A, b):
+    return gauss_piv_solve(gauss_piv_factor(A), b)
@@ -0,0 +1,141 @@
+import time
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import LinearOperator, splu
+
+from SOR import poisson_2d
+
+
+# x → Ax для матрицы, LinearOperator или готовой функции
+def _as_matvec(A):
+    if callable(A) and not isinstance(A, LinearOperator):
+        return A
+    return lambda x: A @ x
+
+
+# M⁻¹r = D⁻¹r
+def jacobi_preconditioner(A):
+    inv_diag = 1.0 / (A.diagonal() if sp.issparse(A) else np.diag(A))
+    return lambda r: inv_diag * r
+
+
+# M⁻¹r = (LLᵀ)⁻¹r, L — неполное разложение Холецкого IC(0) по портрету A
+def ichol_preconditioner(A):
+    lower = sp.tril(sp.csr_matrix(A, dtype=float)).tocsr()
+    lower.sort_indices()
+    n = lower.shape[0]
+    indptr, indices, data = lower.indptr, lower.indices.tolist(), lower.data.tolist()
+    rows = []  # строка i как словарь столбец → значение L
+    for i in range(n):
+        row = {}
+        diag = 0.0
+        for p in range(indptr[i], indptr[i + 1]):
+            k, value = indices[p], data[p]
+            if k == i:
+                diag = value
+                continue
+            # L[i, k] = (A[i, k] - Σ_j L[i, j] L[k, j]) / L[k, k] по общему портрету строк i и k
+            row_k = rows[k]
+            for j, l_ij in row.items():
+                l_kj = row_k.get(j)
+                if l_kj is not None:
+                    value -= l_ij * l_kj
+            row[k] = value / row_k[k]
+        pivot = diag - sum(v * v for v in row.values())
+        if pivot <= 0:
+            raise ValueError(f"IC(0): неположительный ведущий элемент в строке {i}")
+        row[i] = pivot ** 0.5
+        rows.append(row)
+
+    L = sp.csr_matrix((
+        [v for row in rows for v in row.values()],
+        [k for row in rows for k in row.keys()],
+        np.concatenate(([0], np.cumsum([len(row) for row in rows]))),
+    ), shape=lower.shape)
+    # Треугольные решатели готовятся один раз: spsolve_triangular на каждом
+    # применении в десятки раз дороже умножения на матрицу
+    solve_lower = splu(L.tocsc(), permc_spec="NATURAL", diag_pivot_thresh=0).solve
+    solve_upper = splu(L.T.tocsc(), permc_spec="NATURAL", diag_pivot_thresh=0).solve
+    return lambda r: solve_upper(solve_lower(r))
+
+
+# CG для симметричной положительно определённой A (матрица или функция x → Ax);
+# M — функция r → M⁻¹r, возвращает (x, число итераций)
+def conjugate_gradient(A, b, epsilon=1e-9, max_iterations=10000, M=None, x0=None):
+    matvec = _as_matvec(A)
+    b = np.asarray(b, dtype=float)
+    x = np.zeros_like(b) if x0 is None else np.array(x0, dtype=float)
+    r = b - matvec(x) if x0 is not None else b.copy()
+    z = r if M is None else M(r)
+    p = z.copy()
+    rz = r @ z
+
+    for i in range(max_iterations):
+        if np.linalg.norm(r) < epsilon:
+            return x, i
+        Ap = matvec(p)
+        step = rz / (p @ Ap)
+        x += step * p
+        r -= step * Ap
+        z = r if M is None else M(r)
+        rz_new = r @ z
+        p *= rz_new / rz
+        p += z
+        rz = rz_new
+
+    return x, max_iterations
+
+
+# CG с предобусловливателем "jacobi" или "ichol"
+def preconditioned_cg(A, b, epsilon=1e-9, max_iterations=10000, preconditioner="jacobi"):
+    builders = {"jacobi": jacobi_preconditioner, "ichol": ichol_preconditioner}
+    if preconditioner not in builders:
+        raise ValueError(f"Неизвестный предобусловливатель: {preconditioner}")
+    return conjugate_gradient(A, b, epsilon, max_iterations, M=builders[preconditioner](A))
+
+
+def main():
+    A = np.array([
+        [10.9, 1.2, 2.1, 0.9],
+        [1.2, 11.2, 1.5, 2.5],
+        [2.1, 1.5, 9.8, 1.3],
+        [0.9, 2.5, 1.3, 12.1],
+    ])
+    b = np.array([-7.0, 5.3, 10.3, 24.6])
+
+    x, iterations = conjugate_gradient(A, b)
+    print("CG:", x, "итераций:", iterations)
+    print(f'Невязка (норма вектора Ax - b): {np.linalg.norm(A @ x - b)}', end="\n\n")
+
+    # Разреженная система: двумерное уравнение Пуассона
+    m = 200
+    P = poisson_2d(m)
+    rhs = np.ones(m * m)
+    # Тот же оператор без матрицы: 4x - сумма четырёх соседей на сетке
+    def laplacian(v):
+        u = v.reshape(m, m)
+        out = 4 * u
+        out[1:] -= u[:-1]
+        out[:-1] -= u[1:]
+        out[:, 1:] -= u[:, :-1]
+        out[:, :-1] -= u[:, 1:]
+        return out.ravel()
+
+    print(f"Пуассон {m}×{m} ({m * m} неизвестных):")
+    for name, solve in (
+        ("CG", lambda: conjugate_gradient(P, rhs, 1e-8)),
+        ("CG без матрицы", lambda: conjugate_gradient(laplacian, rhs, 1e-8)),
+        ("PCG Якоби", lambda: preconditioned_cg(P, rhs, 1e-8, preconditioner="jacobi")),
+        ("PCG IC(0)", lambda: preconditioned_cg(P, rhs, 1e-8, preconditioner="ichol")),
+    ):
+        t0 = time.perf_counter()
+        x, iterations = solve()
+        elapsed = time.perf_counter() - t0
+        print(f"{name:<16} итераций: {iterations:<6} время: {elapsed:6.2f} с  "
+              f"невязка: {np.linalg.norm(P @ x - rhs):.2e}")
+
+
+if __name__ == '__main__':
+    np.set_printoptions(linewidth=200, suppress=True)
+    main()
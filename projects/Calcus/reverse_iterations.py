@@ -1,19 +1,52 @@
 import numpy as np
-from gaus_piv import gauss_piv
+from gaus_piv import gauss_piv_factor, gauss_piv_solve
 from tabulate import tabulate
 
-def reverse_iterations(A, x0, tol):
-    alpha = np.linalg.norm(x0, ord=np.inf)
+def _signed_max(x):
+    # Наибольшая по модулю компонента со знаком: при λ < 0 норма знак теряет
+    return x[np.argmax(np.abs(x))]
+
+
+# Собственное значение, ближайшее к shift: A - shift·I раскладывается один раз;
+# rayleigh=True после сходимости до √tol сдвигает на отношение Рэлея каждый шаг
+def reverse_iterations(A, x0, tol, shift=0.0, rayleigh=False, max_iter=1000):
+    n = len(A)
+    factorization = gauss_piv_factor(A - shift * np.eye(n))
+    alpha = _signed_max(x0)
     x_old = x0.copy()
-    while True:
-        x_new = gauss_piv(A, x_old / alpha)
-        alpha_new = np.linalg.norm(x_new, ord=np.inf)
+    for _ in range(max_iter):
+        x_new = gauss_piv_solve(factorization, x_old / alpha)
+        alpha_new = _signed_max(x_new)
 
-        if np.abs(alpha_new - alpha) < tol:
-            return 1 / alpha_new, x_new
+        if np.abs(alpha_new - alpha) < (np.sqrt(tol) if rayleigh else tol):
+            break
 
         alpha = alpha_new
         x_old = x_new
+    else:
+        raise ValueError("Метод не сошёлся за заданное число итераций.")
+
+    if not rayleigh:
+        return shift + 1 / alpha_new, x_new / alpha_new
+    return _rayleigh_iterations(A, x_new / alpha_new, tol, max_iter)
+
+
+def _rayleigh_iterations(A, x, tol, max_iter):
+    n = len(A)
+    x = x / np.linalg.norm(x)
+    mu = x @ A @ x
+    for _ in range(max_iter):
+        try:
+            y = gauss_piv_solve(gauss_piv_factor(A - mu * np.eye(n)), x)
+        except ValueError:
+            # A - μI вырождена: μ — точное собственное значение
+            return mu, x
+        x = y / np.linalg.norm(y)
+        mu_new = x @ A @ x
+        if np.abs(mu_new - mu) < tol:
+            return mu_new, x
+        mu = mu_new
+    raise ValueError("Метод не сошёлся за заданное число итераций.")
 
 
 def main():
@@ -54,6 +87,10 @@ def main():
         print("Наименьшее собственное значение по модулю: ", eigenvalue)
         print("Вектор x:", x)
         # Ax - lmd * x
+        print("Проверка:", np.linalg.norm(matrices[i] @ x - eigenvalue * x))
+
+        eigenvalue, x = reverse_iterations(matrices[i], x0, tol, rayleigh=True)
+        print("С отношением Рэлея:", eigenvalue)
         print("Проверка:", np.linalg.norm(matrices[i] @ x - eigenvalue * x), end="\n\n")
 
 
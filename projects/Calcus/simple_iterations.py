@@ -1,4 +1,6 @@
 import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import LinearOperator
 from tabulate import tabulate
 
 def simple_iteration(A, tol, max_iter=1000):
@@ -26,6 +28,49 @@ def simple_iteration(A, tol, max_iter=1000):
     return eigenvalue_old, x
 
 
+# X → AX для блока векторов
+def _as_matmat(A):
+    if sp.issparse(A) or isinstance(A, (np.ndarray, LinearOperator)):
+        return lambda X: A @ X
+    return A
+
+
+# Итерации подпространства для симметричной A: QR и Рэлей-Ритц каждые qr_every шагов;
+# возвращает (k собственных значений, векторы, итерации, применения оператора)
+def block_iteration(A, k, tol=1e-6, max_iter=1000, n=None, block=None, qr_every=1, seed=0):
+    matmat = _as_matmat(A)
+    n = A.shape[0] if n is None else n
+    block = min(n, max(2 * k, k + 5)) if block is None else block
+    X, _ = np.linalg.qr(np.random.default_rng(seed).standard_normal((n, block)))
+    orthonormal = True
+    applications = 0
+
+    for iteration in range(1, max_iter + 1):
+        Y = matmat(X)
+        applications += block
+
+        if orthonormal:
+            # Рэлей-Ритц по текущему подпространству: AX уже посчитано
+            H = X.T @ Y
+            theta, W = np.linalg.eigh((H + H.T) / 2)
+            order = np.argsort(-np.abs(theta))
+            theta, W = theta[order], W[:, order]
+            X, Y = X @ W, Y @ W
+            residual = np.linalg.norm(Y[:, :k] - X[:, :k] * theta[:k], axis=0)
+            if np.all(residual < tol):
+                return theta[:k], X[:, :k], iteration, applications
+
+        if iteration % qr_every == 0:
+            X, _ = np.linalg.qr(Y)
+            orthonormal = True
+        else:
+            X = Y / np.linalg.norm(Y, axis=0)
+            orthonormal = False
+
+    print(f"Достигнут максимум итераций ({max_iter}) без нужной точности.")
+    return theta[:k], X[:, :k], max_iter, applications
+
+
 def main():
     tol = 1e-6
     matrices = [
@@ -63,7 +108,19 @@ def main():
         print("Наибольшее собственное значение по модулю:", eigenvalue)
         print("Вектор x:", x)
         # Ax - lmd * x
-        print("Проверка вида:", np.linalg.norm(matrices[i] @ x - eigenvalue * x), end="\n\n")
+        print("Проверка вида:", np.linalg.norm(matrices[i] @ x - eigenvalue * x))
+
+        eigenvalues, vectors, _, applications = block_iteration(matrices[i], 2, tol)
+        print("Два наибольших по модулю (блочный метод):", eigenvalues,
+              f"— {applications} умножений на вектор", end="\n\n")
+
+    # Разреженная матрица: пять наибольших собственных значений лапласиана
+    m = 30
+    T = sp.diags([-1.0, 2.0, -1.0], [-1, 0, 1], shape=(m, m))
+    L = (sp.kron(sp.identity(m), T) + sp.kron(T, sp.identity(m))).tocsr()
+    eigenvalues, _, iterations, applications = block_iteration(L, 5, tol, max_iter=5000)
+    print(f"Лапласиан {m}×{m}: {eigenvalues}")
+    print(f"Итераций: {iterations}, умножений на вектор: {applications}")
 
 
 if __name__ == '__main__':